@@ -1,22 +1,114 @@
 """
 Main application entry point for the Language Learning Quiz API.
 
-This file creates and runs the Flask application using the application factory pattern.
+This file defines the application factory and creates the Flask application
+that gunicorn serves (`app:app`) or that runs directly in development.
 """
 import os
-from __init__ import create_app
+import decimal
+import orjson
+from flask import Flask
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from flask_cors import CORS
+from config import config
 
-# Determine configuration based on environment
-config_name = os.getenv('FLASK_ENV', 'development')
-app = create_app(config_name)
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson.
+    
+    Installed as app.json, so request.get_json() parses request bodies with
+    orjson, and anything still using flask.jsonify is encoded with it too.
+    """
+    
+    @staticmethod
+    def _default(obj):
+        """Serialize the extra types Flask's default provider supports."""
+        if isinstance(obj, decimal.Decimal):
+            return str(obj)
+        if hasattr(obj, '__html__'):
+            return str(obj.__html__())
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as JSON.
+        
+        Args:
+            obj: The data to serialize
+            
+        Returns:
+            str: JSON text
+        """
+        return orjson.dumps(obj, default=self._default).decode()
+    
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data as JSON.
+        
+        Args:
+            s (str | bytes): JSON text
+            
+        Returns:
+            The decoded data (invalid input raises a ValueError subclass)
+        """
+        return orjson.loads(s)
 
-"""
-Main application entry point for the Language Learning Quiz API.
+def create_app(config_name='default'):
+    """
+    Application factory pattern for creating Flask app instances.
+    
+    Args:
+        config_name (str): The configuration to use ('development', 'production', 'testing')
+    
+    Returns:
+        Flask: Configured Flask application instance
+    """
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    
+    # Load configuration
+    app.config.from_object(config[config_name])
+    
+    # Initialize extensions with app
+    # Importing the models package also registers every model with SQLAlchemy
+    from models import db  # Import the shared db instance
+    db.init_app(app)
+    # Enable CORS for frontend integration; only the API needs it, so health
+    # checks and the index skip the per-request CORS handling
+    CORS(app, resources={r"/api/*": {"origins": app.config.get("CORS_ORIGINS", "*")}})
+    # gzip/brotli for JSON responses when the client accepts it
+    Compress(app)
+    
+    # Register blueprints
+    from routes import register_blueprints
+    register_blueprints(app)
+    
+    # Register CLI commands
+    register_commands(app)
+    
+    # Creating tables probes the schema on every worker boot, so it is opt-in.
+    # Deployments run `flask init-db` once instead.
+    if app.config.get('AUTO_CREATE_TABLES', False):
+        with app.app_context():
+            db.create_all()
+    
+    return app
 
-This file creates and runs the Flask application using the application factory pattern.
-"""
-import os
-from __init__ import create_app
+def register_commands(app):
+    """
+    Register custom Flask CLI commands.
+    
+    Args:
+        app (Flask): The Flask application instance
+    """
+    @app.cli.command('init-db')
+    def init_db():
+        """Create missing database tables and upgrade existing ones."""
+        from models import db, upgrade_schema
+        db.create_all()
+        upgrade_schema()
+        print("✅ Database tables created and up to date")
 
 # Determine configuration based on environment
 config_name = os.getenv('FLASK_ENV', 'development')
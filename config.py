@@ -1,8 +1,10 @@
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file. Production environments are
+# populated by the host, so skip importing dotenv and parsing the file there.
+if os.getenv('FLASK_ENV', 'development') != 'production':
+    from dotenv import load_dotenv
+    load_dotenv()
 
 class Config:
     """Base configuration class."""
@@ -21,11 +23,32 @@ class Config:
         SQLALCHEMY_DATABASE_URI = DATABASE_URL
         
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Connection pool sizing. Keep workers * (pool_size + max_overflow)
+    # below the Postgres max_connections limit.
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_pre_ping': True,  # Verifies connections before use
-        'pool_recycle': 3600,   # Recycle connections every hour
+        # Pre-ping costs a round trip per checkout; rely on pool_recycle
+        # (kept below the server/pgbouncer idle timeout) unless enabled.
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'false').lower() == 'true',
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
     }
     
+    # Reject request bodies larger than this (bytes) with 413 before reading them
+    MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 1024 * 1024))
+    
+    # CORS - comma-separated list of allowed origins for /api/* ('*' allows any)
+    CORS_ORIGINS = [origin.strip() for origin in os.getenv('CORS_ORIGINS', '*').split(',')]
+    
+    # Response compression (Flask-Compress) for JSON bodies worth compressing
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_LEVEL = 5
+    COMPRESS_MIN_SIZE = 500
+    
+    # Create missing tables when the app starts (use `flask init-db` otherwise)
+    AUTO_CREATE_TABLES = os.getenv('AUTO_CREATE_TABLES', 'False').lower() == 'true'
+    
     # Supabase Configuration (for future features)
     SUPABASE_URL = os.getenv('SUPABASE_URL')
     SUPABASE_KEY = os.getenv('SUPABASE_KEY')
@@ -34,24 +57,32 @@ class Config:
 class DevelopmentConfig(Config):
     """Development-specific configuration."""
     DEBUG = True
+    AUTO_CREATE_TABLES = True
 
 class ProductionConfig(Config):
     """Production-specific configuration."""
     DEBUG = False
     
     # Enhanced production database settings
+    # Defaults fit the free tier; raise DB_POOL_SIZE / DB_MAX_OVERFLOW on
+    # larger plans as long as the total stays below max_connections.
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_pre_ping': True,
-        'pool_recycle': 300,  # More aggressive recycling for free tier
-        'pool_size': 5,       # Smaller pool for free tier resources
-        'max_overflow': 0,    # No overflow connections
-        'pool_timeout': 20,   # Connection timeout
+        # Free tier databases pause and restart, so keep pre-ping on by default
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 300)),  # More aggressive recycling for free tier
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),        # Smaller pool for free tier resources
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 0)),  # No overflow connections
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 20)), # Connection timeout
     }
 
 class TestingConfig(Config):
     """Testing-specific configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'  # In-memory for tests
+    # No pool tuning: Flask-SQLAlchemy picks a StaticPool so the in-memory
+    # database survives across connection checkouts.
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    AUTO_CREATE_TABLES = True  # Fresh in-memory schema for every app
 
 # Configuration dictionary
 config = {
@@ -5,9 +5,15 @@ This module provides centralized access to all controller classes
 and common functionality.
 """
 
-from .base_controller import BaseController
-from .quiz_controller import QuizController  
-from .quiz_session_controller import QuizSessionController
+import importlib
+
+# Controller modules are imported lazily on first attribute access (PEP 562),
+# so importing the package does not pull in the models and SQLAlchemy
+_CONTROLLER_MODULES = {
+    'BaseController': '.base_controller',
+    'QuizController': '.quiz_controller',
+    'QuizSessionController': '.quiz_session_controller'
+}
 
 # Make controllers available when importing from controllers package
 __all__ = [
@@ -16,6 +22,28 @@ __all__ = [
     'QuizSessionController'
 ]
 
+def __getattr__(name):
+    """
+    Import a controller class the first time it is accessed.
+    
+    Args:
+        name (str): The attribute being looked up
+        
+    Returns:
+        type: The requested controller class
+    """
+    module_name = _CONTROLLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    controller = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = controller  # Cache so later lookups skip __getattr__
+    return controller
+
+def __dir__():
+    """Include lazily loaded controllers in dir(controllers)."""
+    return sorted(set(globals()) | set(__all__))
+
 # You can add package-level functions or constants here if needed
 # For example:
 
@@ -23,6 +51,15 @@ __all__ = [
 DEFAULT_PAGE_SIZE = 10
 MAX_PAGE_SIZE = 100
 
+# Upper bound on answers accepted in a single quiz submission
+MAX_SUBMITTED_ANSWERS = 500
+
+# Upper bound on submissions accepted in a single batch submit
+MAX_BATCH_SUBMISSIONS = 20
+
+# Upper bound (bytes) on JSON bodies for quiz creation and submission
+MAX_JSON_BODY_BYTES = 256 * 1024
+
 # Common validation patterns
 DIFFICULTY_LEVELS = ['beginner', 'intermediate', 'advanced']
 QUESTION_TYPES = ['multiple_choice', 'true_false', 'fill_blank']
@@ -41,7 +78,7 @@ def get_controller_info():
         },
         'QuizSessionController': {
             'description': 'Manages quiz sessions, submissions, and scoring',
-            'methods': ['start_quiz_session', 'submit_quiz', 'get_quiz_statistics']
+            'methods': ['start_quiz_session', 'submit_quiz', 'submit_quizzes', 'check_time_remaining', 'get_quiz_statistics']
         },
         'BaseController': {
             'description': 'Provides common functionality for all controllers',
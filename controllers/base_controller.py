@@ -4,9 +4,11 @@ Base controller class for the Language Learning Quiz API.
 This module provides common functionality and patterns that all controllers
 can inherit from, promoting consistency and reducing code duplication.
 """
-from flask import jsonify
+from flask import Response, current_app
+from functools import wraps
 from models import db
-import traceback
+from sqlalchemy import tuple_
+import orjson
 
 class BaseController:
     """
@@ -37,7 +39,7 @@ class BaseController:
             "message": message,
             "data": data
         }
-        return jsonify(response_data), status_code
+        return BaseController.json_response(response_data, status_code)
     
     @staticmethod
     def error_response(message="An error occurred", status_code=400, error_details=None):
@@ -57,7 +59,24 @@ class BaseController:
             "message": message,
             "error": error_details
         }
-        return jsonify(response_data), status_code
+        return BaseController.json_response(response_data, status_code)
+    
+    @staticmethod
+    def json_response(data, status_code=200):
+        """
+        Serialize data with orjson into a JSON response.
+        
+        orjson is considerably faster than the stdlib encoder behind jsonify,
+        which matters for large payloads such as quiz lists.
+        
+        Args:
+            data: JSON-serializable data
+            status_code (int): HTTP status code
+            
+        Returns:
+            tuple: (Flask response, status_code)
+        """
+        return Response(orjson.dumps(data), mimetype='application/json'), status_code
     
     @staticmethod
     def validation_error_response(errors):
@@ -87,13 +106,15 @@ class BaseController:
         Returns:
             function: Wrapped function with error handling
         """
+        @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 db.session.rollback()
-                print(f"Database error in {func.__name__}: {str(e)}")
-                print(traceback.format_exc())
+                # logger.exception records the traceback through the logging
+                # handlers instead of formatting it eagerly onto stdout
+                current_app.logger.exception("Database error in %s", func.__name__)
                 return BaseController.error_response(
                     message="A database error occurred",
                     status_code=500,
@@ -120,22 +141,43 @@ class BaseController:
         return errors
     
     @staticmethod
-    def paginate_query(query, page=1, per_page=10, max_per_page=100):
+    def paginate_query(query, page=1, per_page=10, max_per_page=100, cursor=None, cursor_columns=None):
         """
-        Paginate a SQLAlchemy query.
+        Paginate a SQLAlchemy select statement.
+        
+        With a cursor, keyset pagination is used instead of LIMIT/OFFSET: rows
+        after the cursor are found by an index seek, so deep pages cost the same
+        as the first one. The query must then be ordered by cursor_columns,
+        all descending.
         
         Args:
-            query: SQLAlchemy query object
-            page (int): Page number (1-based)
+            query: SQLAlchemy select() statement
+            page (int): Page number (1-based), ignored when a cursor is given
             per_page (int): Items per page
             max_per_page (int): Maximum items per page
+            cursor (tuple): Values of cursor_columns for the last item already seen
+            cursor_columns (tuple): Columns the query is ordered by
             
         Returns:
             dict: Pagination information and results
         """
-        per_page = min(per_page, max_per_page)
+        # Clamp both ways: LIMIT 0/-n returns nothing or everything depending on the database
+        per_page = max(1, min(per_page, max_per_page))
         
-        paginated = query.paginate(
+        if cursor is not None:
+            # Fetch one extra row to learn whether another page exists
+            rows = db.session.execute(
+                query.where(tuple_(*cursor_columns) < tuple(cursor)).limit(per_page + 1)
+            ).scalars().all()
+            
+            return {
+                'items': rows[:per_page],
+                'per_page': per_page,
+                'has_next': len(rows) > per_page
+            }
+        
+        paginated = db.paginate(
+            query,
             page=page,
             per_page=per_page,
             error_out=False
@@ -151,4 +193,4 @@ class BaseController:
             'has_prev': paginated.has_prev,
             'next_num': paginated.next_num,
             'prev_num': paginated.prev_num
-        }
\ No newline at end of file
+        }
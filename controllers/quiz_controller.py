@@ -9,7 +9,136 @@ This module handles all business logic related to quiz management:
 """
 from models import db, Quiz, Question, Answer
 from .base_controller import BaseController
+from . import QUESTION_TYPES
+from utils import ttl_cache
 from datetime import datetime
+from functools import lru_cache
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import selectinload, with_expression
+import orjson
+
+# Built once at import instead of on every validated question
+_VALID_QUESTION_TYPES = frozenset(QUESTION_TYPES)
+_VALID_QUESTION_TYPES_MSG = ', '.join(QUESTION_TYPES)
+
+# Quiz.questions and Question.answers are raise_on_sql; the full views need both
+_WITH_QUESTIONS_AND_ANSWERS = (selectinload(Quiz.questions).selectinload(Question.answers),)
+# The educator view also serializes the deferred Answer.created_at
+_WITH_FULL_QUESTIONS_AND_ANSWERS = (
+    selectinload(Quiz.questions).selectinload(Question.answers).undefer(Answer.created_at),
+)
+
+# Question count per quiz, computed in SQL so list pages need not load questions
+_QUESTION_COUNT = (
+    select(func.count(Question.id)).where(Question.quiz_id == Quiz.id).correlate(Quiz).scalar_subquery()
+)
+
+# Signed 64-bit range; cursor IDs outside it cannot be bound as parameters
+_MIN_BIGINT = -2 ** 63
+_MAX_BIGINT = 2 ** 63 - 1
+
+# Seconds a quiz status/version lookup is reused before hitting the database
+QUIZ_STATUS_TTL = 5
+
+@ttl_cache(ttl=QUIZ_STATUS_TTL, maxsize=1024)
+def _quiz_snapshot(quiz_id):
+    """
+    Look up the quiz columns needed to serve the student view.
+    
+    Together with the per-version student view cache this lets repeated
+    previews and session starts skip the database entirely.
+    
+    Args:
+        quiz_id (int): The quiz ID
+        
+    Returns:
+        Row: (id, is_active, updated_at, version, time_limit), or None if not found
+    """
+    return db.session.execute(
+        select(Quiz.id, Quiz.is_active, Quiz.updated_at, Quiz.version, Quiz.time_limit).where(Quiz.id == quiz_id)
+    ).first()
+
+@lru_cache(maxsize=256)
+def _render_student_quiz(quiz_id, version):
+    """
+    Build the serialized student view of a quiz, memoized per quiz version.
+    
+    Quiz content only changes through update_quiz, which increments version, so
+    a new version gets a new cache key and stale entries simply age out.
+    The view is encoded once and embedded as-is by orjson on every response.
+    
+    Args:
+        quiz_id (int): The quiz ID
+        version (int): The quiz's version counter
+        
+    Returns:
+        orjson.Fragment: Pre-encoded student-safe JSON for the quiz, or None
+            if the quiz has been deleted since its snapshot was taken
+    """
+    quiz = db.session.execute(
+        select(Quiz)
+        .where(Quiz.id == quiz_id)
+        .options(*_WITH_QUESTIONS_AND_ANSWERS)
+    ).scalar_one_or_none()
+    if quiz is None:
+        return None
+    return orjson.Fragment(orjson.dumps(quiz.to_student_dict()))
+
+def _load_full_quiz(quiz_id):
+    """
+    Load a quiz with its questions and answers eagerly.
+    
+    Uses populate_existing so an instance expired by a commit is refreshed
+    together with its collections instead of tripping raise_on_sql.
+    
+    Args:
+        quiz_id (int): The quiz ID
+        
+    Returns:
+        Quiz: The quiz, or None if it does not exist
+    """
+    return db.session.get(Quiz, quiz_id, options=_WITH_FULL_QUESTIONS_AND_ANSWERS, populate_existing=True)
+
+def _validate_question_data(question_data):
+    """
+    Validate question data structure.
+    
+    Args:
+        question_data (dict): Question data to validate
+    
+    Returns:
+        dict: Validation errors (empty if valid)
+    """
+    errors = {}
+    
+    if not question_data.get('text'):
+        errors['text'] = "Question text is required"
+    
+    if not question_data.get('answers') or len(question_data['answers']) < 2:
+        errors['answers'] = "Question must have at least 2 answer choices"
+    
+    question_type = question_data.get('question_type', 'multiple_choice')
+    if question_type not in _VALID_QUESTION_TYPES:
+        errors['question_type'] = f"Question type must be one of: {_VALID_QUESTION_TYPES_MSG}"
+    
+    return errors
+
+def _validate_answer_data(answer_data):
+    """
+    Validate answer data structure.
+    
+    Args:
+        answer_data (dict): Answer data to validate
+    
+    Returns:
+        dict: Validation errors (empty if valid)
+    """
+    errors = {}
+    
+    if not answer_data.get('text'):
+        errors['text'] = "Answer text is required"
+    
+    return errors
 
 class QuizController(BaseController):
     """
@@ -46,43 +175,33 @@ class QuizController(BaseController):
         if not data['questions'] or len(data['questions']) == 0:
             return BaseController.error_response("Quiz must have at least one question", 422)
         
-        # Create the quiz
-        new_quiz = Quiz(
-            title=data['title'],
-            description=data.get('description'),
-            category=data.get('category'),
-            difficulty_level=data.get('difficulty_level', 'beginner'),
-            time_limit=data.get('time_limit'),
-            created_by=created_by
-        )
-        
-        db.session.add(new_quiz)
-        db.session.flush()  # Get the quiz ID without committing
-        
-        # Add questions and answers
+        # Validate the whole payload before touching the database, collecting
+        # question and answer rows so they can be inserted in bulk.
+        # Validators are bound to locals for the per-item loops.
+        validate_question = _validate_question_data
+        validate_answer = _validate_answer_data
+        question_rows = []
+        answer_rows_by_question = []
         for q_index, q_data in enumerate(data['questions']):
-            question_errors = QuizController._validate_question_data(q_data)
+            question_errors = validate_question(q_data)
             if question_errors:
                 return BaseController.validation_error_response({
                     f"question_{q_index}": question_errors
                 })
             
-            new_question = Question(
-                text=q_data['text'],
-                question_type=q_data.get('question_type', 'multiple_choice'),
-                explanation=q_data.get('explanation'),
-                points=q_data.get('points', 1),
-                order_index=q_index,
-                quiz_id=new_quiz.id
-            )
+            question_rows.append({
+                'text': q_data['text'],
+                'question_type': q_data.get('question_type', 'multiple_choice'),
+                'explanation': q_data.get('explanation'),
+                'points': q_data.get('points', 1),
+                'order_index': q_index
+            })
             
-            db.session.add(new_question)
-            db.session.flush()  # Get the question ID
-            
-            # Add answers
+            # Collect answers
+            answer_rows = []
             correct_answer_count = 0
             for a_index, a_data in enumerate(q_data['answers']):
-                answer_errors = QuizController._validate_answer_data(a_data)
+                answer_errors = validate_answer(a_data)
                 if answer_errors:
                     return BaseController.validation_error_response({
                         f"question_{q_index}_answer_{a_index}": answer_errors
@@ -92,15 +211,12 @@ class QuizController(BaseController):
                 if is_correct:
                     correct_answer_count += 1
                 
-                new_answer = Answer(
-                    text=a_data['text'],
-                    is_correct=is_correct,
-                    explanation=a_data.get('explanation'),
-                    order_index=a_index,
-                    question_id=new_question.id
-                )
-                
-                db.session.add(new_answer)
+                answer_rows.append({
+                    'text': a_data['text'],
+                    'is_correct': is_correct,
+                    'explanation': a_data.get('explanation'),
+                    'order_index': a_index
+                })
             
             # Validate that each question has exactly one correct answer
             if correct_answer_count != 1:
@@ -108,11 +224,55 @@ class QuizController(BaseController):
                     f"Question {q_index + 1} must have exactly one correct answer", 
                     422
                 )
+            
+            answer_rows_by_question.append(answer_rows)
+        
+        # Everything is valid: create the quiz
+        new_quiz = Quiz(
+            title=data['title'],
+            description=data.get('description'),
+            category=data.get('category'),
+            difficulty_level=data.get('difficulty_level', 'beginner'),
+            time_limit=data.get('time_limit'),
+            created_by=created_by
+        )
+        
+        db.session.add(new_quiz)
+        db.session.flush()  # Get the quiz ID without committing
+        
+        for row in question_rows:
+            row['quiz_id'] = new_quiz.id
+        
+        # One INSERT for all questions (IDs returned in payload order),
+        # then one INSERT for all answers and one UPDATE recording each
+        # question's correct answer
+        question_ids = db.session.scalars(
+            insert(Question).returning(Question.id, sort_by_parameter_order=True),
+            question_rows
+        ).all()
+        
+        answer_rows = []
+        for question_id, rows in zip(question_ids, answer_rows_by_question):
+            for row in rows:
+                row['question_id'] = question_id
+                answer_rows.append(row)
+        
+        answer_ids = db.session.scalars(
+            insert(Answer).returning(Answer.id, sort_by_parameter_order=True),
+            answer_rows
+        ).all()
+        
+        db.session.execute(update(Question), [
+            {'id': row['question_id'], 'correct_answer_id': answer_id}
+            for row, answer_id in zip(answer_rows, answer_ids)
+            if row['is_correct']
+        ])
         
         db.session.commit()
+        _quiz_snapshot.cache_pop(new_quiz.id)
         
         return BaseController.success_response(
-            data=new_quiz.to_dict(include_questions=True),
+            data=_load_full_quiz(new_quiz.id).to_dict(include_questions=True),
             message="Quiz created successfully!",
             status_code=201
         )
@@ -129,17 +289,29 @@ class QuizController(BaseController):
         Returns:
             tuple: (Flask response, status_code)
         """
-        quiz = Quiz.query.get(quiz_id)
-        
-        if not quiz:
+        # Repeated lookups of missing or inactive quizzes skip the full load
+        snapshot = _quiz_snapshot(quiz_id)
+        if snapshot is None:
             return BaseController.error_response("Quiz not found", 404)
         
-        if not quiz.is_active:
+        if not snapshot.is_active:
             return BaseController.error_response("Quiz is not currently available", 403)
         
         if for_student:
-            quiz_data = quiz.to_student_dict()
+            # Served from the per-version cache without loading the quiz
+            quiz_data = QuizController.get_student_quiz_data(snapshot)
+            if quiz_data is None:
+                return BaseController.error_response("Quiz not found", 404)
         else:
+            # Load questions and answers up front instead of one query per question
+            quiz = db.session.get(Quiz, quiz_id, options=_WITH_FULL_QUESTIONS_AND_ANSWERS)
+            
+            if not quiz:
+                return BaseController.error_response("Quiz not found", 404)
+            
+            if not quiz.is_active:
+                return BaseController.error_response("Quiz is not currently available", 403)
+            
             quiz_data = quiz.to_dict(include_questions=True)
         
         return BaseController.success_response(
@@ -148,48 +320,119 @@ class QuizController(BaseController):
         )
     
     @staticmethod
-    def get_all_quizzes(page=1, per_page=10, category=None, difficulty=None, active_only=True):
+    def get_quiz_snapshot(quiz_id):
+        """
+        Get the briefly cached status and version of a quiz.
+        
+        Updates made through another worker become visible once the entry
+        expires (QUIZ_STATUS_TTL seconds).
+        
+        Args:
+            quiz_id (int): The quiz ID
+            
+        Returns:
+            Row: (id, is_active, updated_at, version, time_limit), or None if not found
+        """
+        return _quiz_snapshot(quiz_id)
+    
+    @staticmethod
+    def get_student_quiz_data(quiz):
+        """
+        Get the student view of a quiz, reusing the cached copy when the quiz
+        has not changed since it was built.
+        
+        Args:
+            quiz: The Quiz object or its snapshot row; only id and version are read
+            
+        Returns:
+            orjson.Fragment: Pre-encoded student view, usable anywhere in
+            response data passed to success_response; None if the quiz no
+            longer exists
+        """
+        quiz_data = _render_student_quiz(quiz.id, quiz.version)
+        if quiz_data is None:
+            # Deleted through another worker while this worker's snapshot
+            # was still fresh; drop it so the next lookup sees the deletion
+            _quiz_snapshot.cache_pop(quiz.id)
+        return quiz_data
+    
+    @staticmethod
+    def get_all_quizzes(page=1, per_page=10, category=None, difficulty=None, active_only=True, cursor=None):
         """
         Get a paginated list of quizzes with optional filtering.
         
+        Every page includes a next_cursor. Passing it back as cursor switches
+        to keyset pagination, which stays fast however deep the client pages.
+        
         Args:
             page (int): Page number
             per_page (int): Items per page
             category (str): Filter by category
             difficulty (str): Filter by difficulty level
             active_only (bool): Only show active quizzes
+            cursor (str): next_cursor from a previous page (overrides page)
             
         Returns:
             tuple: (Flask response, status_code)
         """
-        query = Quiz.query
+        decoded_cursor = None
+        if cursor:
+            decoded_cursor = QuizController._decode_cursor(cursor)
+            if decoded_cursor is None:
+                return BaseController.error_response("Invalid cursor", 422)
+        
+        query = select(Quiz)
         
         if active_only:
-            query = query.filter(Quiz.is_active == True)
+            query = query.where(Quiz.is_active == True)
         
         if category:
-            query = query.filter(Quiz.category == category)
+            query = query.where(Quiz.category == category)
         
         if difficulty:
-            query = query.filter(Quiz.difficulty_level == difficulty)
+            query = query.where(Quiz.difficulty_level == difficulty)
         
-        query = query.order_by(Quiz.created_at.desc())
+        # id breaks ties so the order (and therefore the cursor) is stable
+        query = query.order_by(Quiz.created_at.desc(), Quiz.id.desc())
         
-        pagination_data = BaseController.paginate_query(query, page, per_page)
+        # to_dict() reports question_count; count in the same query instead of
+        # loading every question on the page
+        query = query.options(with_expression(Quiz.question_count, _QUESTION_COUNT))
+        
+        pagination_data = BaseController.paginate_query(
+            query, page, per_page,
+            cursor=decoded_cursor,
+            cursor_columns=(Quiz.created_at, Quiz.id)
+        )
+        
+        items = pagination_data['items']
+        next_cursor = None
+        if pagination_data['has_next'] and items:
+            next_cursor = QuizController._encode_cursor(items[-1])
         
         # Convert quizzes to dictionary format
-        quiz_list = [quiz.to_dict() for quiz in pagination_data['items']]
+        quiz_list = [quiz.to_dict() for quiz in items]
         
-        response_data = {
-            'quizzes': quiz_list,
-            'pagination': {
+        if decoded_cursor is not None:
+            pagination = {
+                'per_page': pagination_data['per_page'],
+                'has_next': pagination_data['has_next'],
+                'next_cursor': next_cursor
+            }
+        else:
+            pagination = {
                 'total': pagination_data['total'],
                 'pages': pagination_data['pages'],
                 'current_page': pagination_data['current_page'],
                 'per_page': pagination_data['per_page'],
                 'has_next': pagination_data['has_next'],
-                'has_prev': pagination_data['has_prev']
+                'has_prev': pagination_data['has_prev'],
+                'next_cursor': next_cursor
             }
+        
+        response_data = {
+            'quizzes': quiz_list,
+            'pagination': pagination
         }
         
         return BaseController.success_response(
@@ -211,7 +454,7 @@ class QuizController(BaseController):
         Returns:
             tuple: (Flask response, status_code)
         """
-        quiz = Quiz.query.get(quiz_id)
+        quiz = db.session.get(Quiz, quiz_id)
         
         if not quiz:
             return BaseController.error_response("Quiz not found", 404)
@@ -230,12 +473,16 @@ class QuizController(BaseController):
         if 'is_active' in data:
             quiz.is_active = data['is_active']
         
-        quiz.updated_at = datetime.utcnow()
+        quiz.updated_at = func.now()  # Let the database stamp the update time
+        # updated_at can repeat within a second (SQLite's CURRENT_TIMESTAMP),
+        # so the student view cache is keyed on this counter instead
+        quiz.version = Quiz.version + 1
         
         db.session.commit()
+        _quiz_snapshot.cache_pop(quiz_id)
         
         return BaseController.success_response(
-            data=quiz.to_dict(include_questions=True),
+            data=_load_full_quiz(quiz_id).to_dict(include_questions=True),
             message="Quiz updated successfully"
         )
     
@@ -251,58 +498,51 @@ class QuizController(BaseController):
         Returns:
             tuple: (Flask response, status_code)
         """
-        quiz = Quiz.query.get(quiz_id)
+        # The delete cascade walks questions and answers, so load them in bulk
+        quiz = db.session.get(Quiz, quiz_id, options=_WITH_QUESTIONS_AND_ANSWERS)
         
         if not quiz:
             return BaseController.error_response("Quiz not found", 404)
         
         db.session.delete(quiz)  # Cascade will delete questions and answers
         db.session.commit()
+        _quiz_snapshot.cache_pop(quiz_id)
         
         return BaseController.success_response(
             message=f"Quiz '{quiz.title}' deleted successfully"
         )
     
     @staticmethod
-    def _validate_question_data(question_data):
+    def _encode_cursor(quiz):
         """
-        Validate question data structure.
+        Build the keyset cursor pointing just after a quiz.
         
         Args:
-            question_data (dict): Question data to validate
+            quiz (Quiz): The last quiz on the current page
             
         Returns:
-            dict: Validation errors (empty if valid)
+            str: Cursor in the form '<created_at ISO timestamp>:<id>'
         """
-        errors = {}
-        
-        if not question_data.get('text'):
-            errors['text'] = "Question text is required"
-        
-        if not question_data.get('answers') or len(question_data['answers']) < 2:
-            errors['answers'] = "Question must have at least 2 answer choices"
-        
-        question_type = question_data.get('question_type', 'multiple_choice')
-        valid_types = ['multiple_choice', 'true_false', 'fill_blank']
-        if question_type not in valid_types:
-            errors['question_type'] = f"Question type must be one of: {', '.join(valid_types)}"
-        
-        return errors
+        created_at = quiz.created_at.isoformat() if quiz.created_at else ''
+        return f"{created_at}:{quiz.id}"
     
     @staticmethod
-    def _validate_answer_data(answer_data):
+    def _decode_cursor(cursor):
         """
-        Validate answer data structure.
+        Parse a cursor produced by _encode_cursor.
         
         Args:
-            answer_data (dict): Answer data to validate
+            cursor (str): The cursor string
             
         Returns:
-            dict: Validation errors (empty if valid)
+            tuple: (created_at, id), or None if the cursor is malformed
         """
-        errors = {}
-        
-        if not answer_data.get('text'):
-            errors['text'] = "Answer text is required"
-        
-        return errors
+        created_at, _, quiz_id = cursor.rpartition(':')
+        try:
+            created_at, quiz_id = datetime.fromisoformat(created_at), int(quiz_id)
+        except ValueError:
+            return None
+        # Out-of-range IDs would only fail later, when bound to the query
+        if not _MIN_BIGINT <= quiz_id <= _MAX_BIGINT:
+            return None
+        return created_at, quiz_id
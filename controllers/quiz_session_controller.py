@@ -9,8 +9,49 @@ This module handles quiz-taking sessions, including:
 """
 from models import db, Quiz, Question, Answer
 from .base_controller import BaseController
-from datetime import datetime, timedelta
-import json
+from .quiz_controller import QuizController
+from . import MAX_BATCH_SUBMISSIONS, MAX_SUBMITTED_ANSWERS
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import selectinload
+from datetime import datetime, timedelta, timezone
+import bisect
+import time
+
+# Lower bounds (inclusive) of each letter grade above F
+_GRADE_CUTOFFS = (60, 70, 80, 90)
+_GRADES = ('F', 'D', 'C', 'B', 'A')
+
+# Namespaces session tokens so other signed values are never accepted as one
+_SESSION_TOKEN_SALT = 'quiz-session'
+
+# Feedback message and suggestions for each grade band, indexed like _GRADES
+_FEEDBACK = (
+    ("This is a challenging topic - don't give up!", (
+        "Review the study material carefully",
+        "Start with easier quizzes to build your foundation",
+        "Consider getting help from a teacher or study group",
+        "Take your time and try again when you feel ready"
+    )),
+    ("You're making progress, but there's room for improvement.", (
+        "Review the material and try again",
+        "Consider studying the explanations for incorrect answers",
+        "Practice with similar quizzes to build confidence"
+    )),
+    ("Good work! You're getting the hang of it.", (
+        "Focus on reviewing the areas where you made mistakes",
+        "Try some practice exercises to strengthen weak areas"
+    )),
+    ("Great job! You have a solid understanding of the material.", (
+        "Review the questions you missed for even better results",
+        "You're doing well - keep practicing!"
+    )),
+    ("Excellent work! You've mastered this material.", (
+        "Consider trying a more challenging {difficulty_level} quiz",
+        "You're ready to move on to advanced topics"
+    ))
+)
 
 class QuizSessionController(BaseController):
     """
@@ -35,7 +76,9 @@ class QuizSessionController(BaseController):
         Returns:
             tuple: (Flask response, status_code)
         """
-        quiz = Quiz.query.get(quiz_id)
+        # The student view is cached per quiz version, so the cached snapshot
+        # of the quiz row is enough and repeated starts skip the database
+        quiz = QuizController.get_quiz_snapshot(quiz_id)
         
         if not quiz:
             return BaseController.error_response("Quiz not found", 404)
@@ -43,11 +86,22 @@ class QuizSessionController(BaseController):
         if not quiz.is_active:
             return BaseController.error_response("Quiz is not currently available", 403)
         
+        quiz_data = QuizController.get_student_quiz_data(quiz)
+        if quiz_data is None:
+            return BaseController.error_response("Quiz not found", 404)
+        
+        # The signed token carries the server's start time, so time checks
+        # need no server-side session store and cannot be moved by the client
+        started_at_epoch = int(time.time())
+        session_token = QuizSessionController._session_serializer().dumps([quiz.id, started_at_epoch])
+        
         # Calculate session end time if there's a time limit
         session_data = {
-            'quiz': quiz.to_student_dict(),
+            'quiz': quiz_data,
             'session_info': {
                 'started_at': datetime.utcnow().isoformat(),
+                'started_at_epoch': started_at_epoch,
+                'session_token': session_token,
                 'student_id': student_id,
                 'time_limit_minutes': quiz.time_limit
             }
@@ -76,107 +130,396 @@ class QuizSessionController(BaseController):
         Returns:
             tuple: (Flask response, status_code)
         """
-        quiz = Quiz.query.get(quiz_id)
+        # Validate submission data before any database work
+        if 'answers' not in submission_data:
+            return BaseController.error_response("Submission must include answers", 422)
+        
+        try:
+            submitted_lookup = QuizSessionController._build_submitted_lookup(submission_data['answers'])
+        except ValueError as e:
+            return BaseController.error_response(str(e), 422)
+        
+        # Answers are fetched selectively while scoring, so only load questions
+        quiz = db.session.get(Quiz, quiz_id, options=[selectinload(Quiz.questions)])
+        
+        status_code, outcome = QuizSessionController._submit_one(quiz, quiz_id, submission_data, submitted_lookup)
+        if status_code != 200:
+            return BaseController.error_response(outcome, status_code)
+        
+        return BaseController.success_response(
+            data=outcome,
+            message="Quiz submitted successfully!"
+        )
+    
+    @staticmethod
+    def submit_quizzes(submissions, student_id=None):
+        """
+        Score several quiz submissions in one request.
+        
+        All quizzes are loaded with a single query and the results are
+        returned in one response. Each submission succeeds or fails on its
+        own, so one bad entry does not reject the rest.
+        
+        Args:
+            submissions (list): Submission payloads, each with a quiz_id, answers
+                and the optional timing info accepted by submit_quiz
+            student_id (str): Optional student identifier
+            
+        Returns:
+            tuple: (Flask response, status_code)
+        """
+        if not isinstance(submissions, list) or not submissions:
+            return BaseController.error_response("'submissions' must be a non-empty list", 422)
+        
+        if len(submissions) > MAX_BATCH_SUBMISSIONS:
+            return BaseController.error_response(
+                f"A batch can include at most {MAX_BATCH_SUBMISSIONS} submissions", 422
+            )
+        
+        # Validate every entry before touching the database
+        results = [None] * len(submissions)
+        pending = []
+        for index, submission in enumerate(submissions):
+            quiz_id = submission.get('quiz_id') if isinstance(submission, dict) else None
+            if type(quiz_id) is not int:
+                results[index] = QuizSessionController._batch_error(quiz_id, 422, "Submission must include an integer quiz_id")
+                continue
+            if 'answers' not in submission:
+                results[index] = QuizSessionController._batch_error(quiz_id, 422, "Submission must include answers")
+                continue
+            try:
+                submitted_lookup = QuizSessionController._build_submitted_lookup(submission['answers'])
+            except ValueError as e:
+                results[index] = QuizSessionController._batch_error(quiz_id, 422, str(e))
+                continue
+            pending.append((index, quiz_id, submission, submitted_lookup))
+        
+        quizzes = {}
+        if pending:
+            quizzes = {
+                quiz.id: quiz
+                for quiz in db.session.scalars(
+                    select(Quiz)
+                    .where(Quiz.id.in_({quiz_id for _, quiz_id, _, _ in pending}))
+                    .options(selectinload(Quiz.questions))
+                )
+            }
+        
+        for index, quiz_id, submission, submitted_lookup in pending:
+            status_code, outcome = QuizSessionController._submit_one(
+                quizzes.get(quiz_id), quiz_id, submission, submitted_lookup
+            )
+            if status_code != 200:
+                results[index] = QuizSessionController._batch_error(quiz_id, status_code, outcome)
+            else:
+                results[index] = {'quiz_id': quiz_id, 'success': True, 'data': outcome}
+        
+        return BaseController.success_response(
+            data={'results': results},
+            message="Quiz batch processed"
+        )
+    
+    @staticmethod
+    def _submit_one(quiz, quiz_id, submission_data, submitted_lookup):
+        """
+        Check that a quiz can be submitted to, then score one submission.
         
+        Args:
+            quiz (Quiz): The quiz with questions loaded, or None if not found
+            quiz_id (int): The quiz ID
+            submission_data (dict): Submission payload (for timing info)
+            submitted_lookup (dict): question_id -> submitted answer_id
+            
+        Returns:
+            tuple: (status_code, results dict on success or error message)
+        """
         if not quiz:
-            return BaseController.error_response("Quiz not found", 404)
+            return 404, "Quiz not found"
         
         if not quiz.is_active:
-            return BaseController.error_response("Quiz is not currently available", 403)
+            return 403, "Quiz is not currently available"
         
-        # Validate submission data
-        if 'answers' not in submission_data:
-            return BaseController.error_response("Submission must include answers", 422)
-        
-        answers_data = submission_data['answers']
+        # A token that fails verification must not fall back to the
+        # client-supplied start times, or forging one would skip the check
+        session_token = submission_data.get('session_token')
+        if session_token is not None and QuizSessionController._verify_session_token(quiz_id, session_token) is None:
+            return 422, "Invalid session token"
         
         # Check if time limit was exceeded (if applicable)
-        if quiz.time_limit and 'started_at' in submission_data:
-            try:
-                started_at = datetime.fromisoformat(submission_data['started_at'].replace('Z', '+00:00'))
-                time_elapsed = (datetime.utcnow() - started_at).total_seconds() / 60
-                if time_elapsed > quiz.time_limit:
-                    return BaseController.error_response(
-                        "Time limit exceeded for this quiz", 
-                        422
-                    )
-            except (ValueError, KeyError):
-                # If we can't parse the start time, continue without time validation
-                pass
+        if quiz.time_limit:
+            time_elapsed = QuizSessionController._elapsed_minutes(quiz_id, submission_data)
+            # If we can't parse the start time, continue without time validation
+            if time_elapsed is not None and time_elapsed > quiz.time_limit:
+                return 422, "Time limit exceeded for this quiz"
         
         # Process answers and calculate score
-        results = QuizSessionController._process_quiz_submission(quiz, answers_data)
+        return 200, QuizSessionController._process_quiz_submission(quiz, submitted_lookup)
+    
+    @staticmethod
+    def _batch_error(quiz_id, status_code, message):
+        """
+        Build the result entry for a batch submission that failed.
+        
+        Args:
+            quiz_id: The submitted quiz ID (may be invalid)
+            status_code (int): Status the single-quiz endpoint would return
+            message (str): Error message
+            
+        Returns:
+            dict: Failed result entry
+        """
+        return {'quiz_id': quiz_id, 'success': False, 'status': status_code, 'message': message}
+    
+    @staticmethod
+    def check_time_remaining(quiz_id, timing_data):
+        """
+        Report how much of a quiz's time limit is left for a session.
+        
+        Args:
+            quiz_id (int): The quiz ID
+            timing_data (dict): Contains session_token, started_at_epoch or started_at
+            
+        Returns:
+            tuple: (Flask response, status_code)
+        """
+        # Clients poll this endpoint, so read time_limit from the cached snapshot
+        quiz = QuizController.get_quiz_snapshot(quiz_id)
+        
+        if not quiz:
+            return BaseController.error_response("Quiz not found", 404)
+        
+        if not quiz.time_limit:
+            return BaseController.success_response(
+                data={"unlimited": True},
+                message="This quiz has no time limit"
+            )
+        
+        elapsed_minutes = QuizSessionController._elapsed_minutes(quiz_id, timing_data)
+        if elapsed_minutes is None:
+            if timing_data.get('session_token') is not None:
+                return BaseController.error_response("Invalid session token", 422)
+            return BaseController.error_response("Invalid 'started_at' format", 422)
+        
+        remaining_minutes = max(0, quiz.time_limit - elapsed_minutes)
         
         return BaseController.success_response(
-            data=results,
-            message="Quiz submitted successfully!"
+            data={
+                "time_limit_minutes": quiz.time_limit,
+                "elapsed_minutes": round(elapsed_minutes, 2),
+                "remaining_minutes": round(remaining_minutes, 2),
+                "is_expired": remaining_minutes <= 0
+            },
+            message="Time check completed"
         )
     
     @staticmethod
-    def _process_quiz_submission(quiz, submitted_answers):
+    def _session_serializer():
+        """
+        Get the serializer that signs session tokens with the app's SECRET_KEY.
+        
+        Returns:
+            URLSafeSerializer: Serializer for [quiz_id, started_at_epoch] tokens
+        """
+        return URLSafeSerializer(current_app.config['SECRET_KEY'], salt=_SESSION_TOKEN_SALT)
+    
+    @staticmethod
+    def _verify_session_token(quiz_id, session_token):
+        """
+        Check a session token and read the start time it was signed with.
+        
+        Args:
+            quiz_id (int): The quiz the session must belong to
+            session_token: session_info.session_token as sent by the client
+            
+        Returns:
+            int: Session start as a Unix timestamp, or None if the token is
+            malformed, tampered with or was issued for another quiz
+        """
+        try:
+            token_quiz_id, started_at_epoch = QuizSessionController._session_serializer().loads(session_token)
+        except (BadSignature, TypeError, ValueError):
+            return None
+        if token_quiz_id != quiz_id:
+            return None
+        return started_at_epoch
+    
+    @staticmethod
+    def _elapsed_minutes(quiz_id, submission_data):
+        """
+        Minutes since the session started, from the submitted start time.
+        
+        The session_token from start_quiz_session is authoritative when sent:
+        its start time was signed by the server. Otherwise started_at_epoch
+        is preferred since it needs no parsing; the ISO started_at string is
+        still accepted.
+        
+        Args:
+            quiz_id (int): The quiz the session belongs to
+            submission_data (dict): Submission payload
+            
+        Returns:
+            float: Elapsed minutes, or None if no usable start time was sent
+        """
+        session_token = submission_data.get('session_token')
+        if session_token is not None:
+            started_at_epoch = QuizSessionController._verify_session_token(quiz_id, session_token)
+            if started_at_epoch is None:
+                return None
+            return (time.time() - started_at_epoch) / 60.0
+        
+        started_at_epoch = submission_data.get('started_at_epoch')
+        if isinstance(started_at_epoch, (int, float)) and not isinstance(started_at_epoch, bool):
+            return (time.time() - started_at_epoch) / 60.0
+        
+        started_at = submission_data.get('started_at')
+        if not isinstance(started_at, str):
+            return None
+        
+        try:
+            started_at = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        
+        if started_at.tzinfo is not None:
+            # Compare on naive UTC, matching the started_at this API hands out
+            started_at = started_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return (datetime.utcnow() - started_at).total_seconds() / 60
+    
+    @staticmethod
+    def _build_submitted_lookup(submitted_answers):
+        """
+        Map each answered question ID to the submitted answer ID.
+        
+        Entries missing either ID are skipped.
+        
+        Args:
+            submitted_answers (list): List of submitted answer data
+            
+        Returns:
+            dict: question_id -> answer_id
+            
+        Raises:
+            ValueError: If the payload is malformed or too large, an ID is not
+                an integer, or a question is answered twice
+        """
+        if not isinstance(submitted_answers, list):
+            raise ValueError("Answers must be a list")
+        
+        if len(submitted_answers) > MAX_SUBMITTED_ANSWERS:
+            raise ValueError(f"A submission can include at most {MAX_SUBMITTED_ANSWERS} answers")
+        
+        submitted_lookup = {}
+        for answer in submitted_answers:
+            if not isinstance(answer, dict):
+                raise ValueError("Each answer must be an object")
+            
+            question_id = answer.get('question_id')
+            answer_id = answer.get('answer_id')
+            if question_id is None or answer_id is None:
+                continue
+            
+            try:
+                question_id = int(question_id)
+                answer_id = int(answer_id)
+            except (TypeError, ValueError):
+                raise ValueError("Answer IDs must be integers")
+            
+            if question_id in submitted_lookup:
+                raise ValueError(f"Question {question_id} was answered more than once")
+            submitted_lookup[question_id] = answer_id
+        
+        return submitted_lookup
+    
+    @staticmethod
+    def _process_quiz_submission(quiz, submitted_lookup):
         """
         Process quiz submission and calculate detailed results.
         
         Args:
             quiz (Quiz): The quiz object
-            submitted_answers (list): List of submitted answer data
+            submitted_lookup (dict): question_id -> submitted answer_id
             
         Returns:
             dict: Detailed quiz results with scoring and feedback
         """
-        # Initialize result tracking
+        # Initialize result tracking; questions are walked once and the
+        # possible points accumulated in the scoring loop
+        questions = list(quiz.questions)
         correct_count = 0
-        total_questions = len(quiz.questions)
-        total_points_possible = sum(q.points for q in quiz.questions)
+        total_questions = len(questions)
+        total_points_possible = 0
         total_points_earned = 0
         question_results = []
         
-        # Create lookup for submitted answers
-        submitted_lookup = {
-            int(answer['question_id']): int(answer['answer_id']) 
-            for answer in submitted_answers 
-            if 'question_id' in answer and 'answer_id' in answer
-        }
+        # Correctness is decided from Question.correct_answer_id; the correct
+        # and submitted answers are fetched by primary key in a single query
+        # only for the feedback payloads. Questions stored before that column
+        # existed have it NULL, so their correct answer comes from
+        # Answer.is_correct in the same query.
+        question_ids = [q.id for q in questions]
+        answer_ids = {q.correct_answer_id for q in questions if q.correct_answer_id is not None}
+        answer_ids.update(submitted_lookup.values())
+        unresolved_ids = [q.id for q in questions if q.correct_answer_id is None]
+        
+        conditions = []
+        if answer_ids:
+            conditions.append(Answer.id.in_(answer_ids))
+        if unresolved_ids:
+            conditions.append(and_(Answer.question_id.in_(unresolved_ids), Answer.is_correct == True))
+        
+        answers_by_id = {}
+        fallback_correct_ids = {}
+        if conditions:
+            for a in db.session.scalars(
+                select(Answer).where(Answer.question_id.in_(question_ids), or_(*conditions)).order_by(Answer.id)
+            ):
+                answers_by_id[a.id] = a
+                if a.is_correct:
+                    fallback_correct_ids.setdefault(a.question_id, a.id)
         
         # Process each question
-        for question in quiz.questions:
+        for question in questions:
+            total_points_possible += question.points
             submitted_answer_id = submitted_lookup.get(question.id)
-            correct_answer = question.get_correct_answer()
+            correct_answer_id = question.correct_answer_id
+            if correct_answer_id is None:
+                correct_answer_id = fallback_correct_ids.get(question.id)
+            correct_answer = answers_by_id.get(correct_answer_id)
             
             # Determine if answer was correct
-            is_correct = False
-            if submitted_answer_id and correct_answer:
-                is_correct = submitted_answer_id == correct_answer.id
+            is_correct = correct_answer_id is not None and submitted_answer_id == correct_answer_id
+            points_earned = question.points if is_correct else 0
             
             if is_correct:
                 correct_count += 1
-                total_points_earned += question.points
+                total_points_earned += points_earned
             
             # Find the submitted answer object for detailed feedback
-            submitted_answer = None
-            if submitted_answer_id:
-                submitted_answer = next(
-                    (a for a in question.answers if a.id == submitted_answer_id), 
-                    None
-                )
+            submitted_answer = answers_by_id.get(submitted_answer_id)
+            if submitted_answer is not None and submitted_answer.question_id != question.id:
+                submitted_answer = None  # Belongs to a different question
             
             # Build question result
+            submitted_answer_payload = {
+                'id': submitted_answer.id,
+                'text': submitted_answer.text
+            } if submitted_answer is not None else None
+            
+            correct_answer_payload = {
+                'id': correct_answer.id,
+                'text': correct_answer.text,
+                'explanation': correct_answer.explanation
+            } if correct_answer is not None else None
+            
             question_result = {
                 'question_id': question.id,
                 'question_text': question.text,
                 'question_type': question.question_type,
                 'points_possible': question.points,
-                'points_earned': question.points if is_correct else 0,
+                'points_earned': points_earned,
                 'is_correct': is_correct,
-                'submitted_answer': {
-                    'id': submitted_answer.id if submitted_answer else None,
-                    'text': submitted_answer.text if submitted_answer else None
-                } if submitted_answer else None,
-                'correct_answer': {
-                    'id': correct_answer.id if correct_answer else None,
-                    'text': correct_answer.text if correct_answer else None,
-                    'explanation': correct_answer.explanation if correct_answer else None
-                } if correct_answer else None,
+                'submitted_answer': submitted_answer_payload,
+                'correct_answer': correct_answer_payload,
                 'question_explanation': question.explanation
             }
             
@@ -227,16 +570,7 @@ class QuizSessionController(BaseController):
         Returns:
             str: Letter grade
         """
-        if percentage >= 90:
-            return 'A'
-        elif percentage >= 80:
-            return 'B'
-        elif percentage >= 70:
-            return 'C'
-        elif percentage >= 60:
-            return 'D'
-        else:
-            return 'F'
+        return _GRADES[bisect.bisect_right(_GRADE_CUTOFFS, percentage)]
     
     @staticmethod
     def _generate_performance_feedback(percentage, difficulty_level):
@@ -250,46 +584,11 @@ class QuizSessionController(BaseController):
         Returns:
             dict: Feedback message and suggestions
         """
-        feedback = {
-            'message': '',
-            'suggestions': []
+        message, suggestions = _FEEDBACK[bisect.bisect_right(_GRADE_CUTOFFS, percentage)]
+        return {
+            'message': message,
+            'suggestions': [suggestion.format(difficulty_level=difficulty_level) for suggestion in suggestions]
         }
-        
-        if percentage >= 90:
-            feedback['message'] = "Excellent work! You've mastered this material."
-            feedback['suggestions'] = [
-                f"Consider trying a more challenging {difficulty_level} quiz",
-                "You're ready to move on to advanced topics"
-            ]
-        elif percentage >= 80:
-            feedback['message'] = "Great job! You have a solid understanding of the material."
-            feedback['suggestions'] = [
-                "Review the questions you missed for even better results",
-                "You're doing well - keep practicing!"
-            ]
-        elif percentage >= 70:
-            feedback['message'] = "Good work! You're getting the hang of it."
-            feedback['suggestions'] = [
-                "Focus on reviewing the areas where you made mistakes",
-                "Try some practice exercises to strengthen weak areas"
-            ]
-        elif percentage >= 60:
-            feedback['message'] = "You're making progress, but there's room for improvement."
-            feedback['suggestions'] = [
-                "Review the material and try again",
-                "Consider studying the explanations for incorrect answers",
-                "Practice with similar quizzes to build confidence"
-            ]
-        else:
-            feedback['message'] = "This is a challenging topic - don't give up!"
-            feedback['suggestions'] = [
-                "Review the study material carefully",
-                "Start with easier quizzes to build your foundation",
-                "Consider getting help from a teacher or study group",
-                "Take your time and try again when you feel ready"
-            ]
-        
-        return feedback
     
     @staticmethod
     def get_quiz_statistics(quiz_id):
@@ -304,17 +603,27 @@ class QuizSessionController(BaseController):
         Returns:
             tuple: (Flask response, status_code)
         """
-        quiz = Quiz.query.get(quiz_id)
+        # Aggregate in the database rather than loading Quiz and Question objects
+        row = db.session.execute(
+            select(
+                Quiz.title,
+                func.count(Question.id).label('total_questions'),
+                func.coalesce(func.sum(Question.points), 0).label('total_points')
+            )
+            .outerjoin(Question, Question.quiz_id == Quiz.id)
+            .where(Quiz.id == quiz_id)
+            .group_by(Quiz.id, Quiz.title)
+        ).first()
         
-        if not quiz:
+        if row is None:
             return BaseController.error_response("Quiz not found", 404)
         
         # This is a placeholder - in a real application, you'd query a submissions table
         stats = {
             'quiz_id': quiz_id,
-            'quiz_title': quiz.title,
-            'total_questions': len(quiz.questions),
-            'total_points': sum(q.points for q in quiz.questions),
+            'quiz_title': row.title,
+            'total_questions': row.total_questions,
+            'total_points': int(row.total_points),
             'note': 'Statistics tracking would require a submissions table for full implementation'
         }
         
@@ -0,0 +1,35 @@
+"""
+Gunicorn settings for the Language Learning Quiz API.
+
+Gunicorn loads this file automatically when started from the project root
+(see Procfile). Worker and thread counts come from the environment so they
+can be sized per plan without a code change.
+"""
+import os
+
+# Bind to the port the platform provides (Render sets PORT)
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# A few processes for CPU-bound work (JSON, scoring) plus a few threads each
+# to overlap database round trips. Every worker holds its own connection pool,
+# so keep WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below the
+# database's connection limit and GUNICORN_THREADS <= DB_POOL_SIZE + DB_MAX_OVERFLOW.
+# The default is fixed rather than derived from the CPU count: 2 workers with
+# the production pool (5, no overflow) hold at most 10 connections whatever
+# the host size. Scale up by setting WEB_CONCURRENCY explicitly.
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+
+# Kill requests stuck for longer than this (seconds)
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = 100
+
+# Each worker imports the app itself (no preload), so database pools and
+# process-local caches are never shared across a fork
+preload_app = False
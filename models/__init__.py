@@ -5,6 +5,7 @@ This module sets up SQLAlchemy and provides the database instance
 that will be used across all models.
 """
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 
 # Initialize the database instance
 db = SQLAlchemy()
@@ -15,4 +16,48 @@ from .question import Question
 from .answer import Answer
 
 # Make models available when importing from models package
-__all__ = ['db', 'Quiz', 'Question', 'Answer']
+__all__ = ['db', 'Quiz', 'Question', 'Answer', 'upgrade_schema']
+
+# Indexes from earlier releases that current ones replace; upgrade_schema
+# drops them so they stop costing every write
+_SUPERSEDED_INDEXES = (
+    'ix_answer_question_correct',  # Replaced by ix_answer_question_id + ix_answer_correct_partial
+)
+
+def upgrade_schema():
+    """
+    Bring tables created by an earlier release up to the current models.
+    
+    db.create_all() only creates missing tables, so columns and indexes added
+    to existing tables are applied here, and superseded indexes dropped. Safe to run repeatedly; run it via
+    `flask init-db` after deploying a new release.
+    """
+    inspector = inspect(db.engine)
+    
+    quiz_columns = {column['name'] for column in inspector.get_columns('quiz')}
+    if 'version' not in quiz_columns:
+        db.session.execute(text('ALTER TABLE quiz ADD COLUMN version INTEGER NOT NULL DEFAULT 1'))
+    
+    question_columns = {column['name'] for column in inspector.get_columns('question')}
+    if 'correct_answer_id' not in question_columns:
+        db.session.execute(text(
+            'ALTER TABLE question ADD COLUMN correct_answer_id INTEGER '
+            'CONSTRAINT fk_question_correct_answer_id REFERENCES answer (id) ON DELETE SET NULL'
+        ))
+    
+    # Questions stored before correct_answer_id existed (lowest ID wins, as
+    # when scoring falls back to Answer.is_correct)
+    db.session.execute(text(
+        'UPDATE question SET correct_answer_id = ('
+        'SELECT MIN(answer.id) FROM answer '
+        'WHERE answer.question_id = question.id AND answer.is_correct'
+        ') WHERE correct_answer_id IS NULL'
+    ))
+    
+    for index_name in _SUPERSEDED_INDEXES:
+        db.session.execute(text(f'DROP INDEX IF EXISTS {index_name}'))
+    db.session.commit()
+    
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
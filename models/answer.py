@@ -6,6 +6,7 @@ Each answer belongs to a question and indicates whether it's the correct choice.
 """
 from models import db
 from datetime import datetime
+from sqlalchemy.orm import deferred
 
 class Answer(db.Model):
     """
@@ -25,6 +26,15 @@ class Answer(db.Model):
     """
     
     __tablename__ = 'answer'
+    __table_args__ = (
+        # Foreign-key lookups (loading a question's answers)
+        db.Index('ix_answer_question_id', 'question_id'),
+        # Correct-answer lookups: only ~1 row in 4 is correct, so a partial
+        # index keeps this small
+        db.Index('ix_answer_correct_partial', 'question_id',
+                 postgresql_where=db.text('is_correct'),
+                 sqlite_where=db.text('is_correct')),
+    )
     
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
@@ -37,8 +47,9 @@ class Answer(db.Model):
     # Answer Settings
     order_index = db.Column(db.Integer, default=0)  # Display order within question
     
-    # Metadata
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Metadata - only the educator view reads it, so it is not loaded by
+    # default; undefer it where needed (raises instead of lazy loading)
+    created_at = deferred(db.Column(db.DateTime, default=datetime.utcnow), raiseload=True)
     
     # Foreign Keys
     question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
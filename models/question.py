@@ -25,6 +25,8 @@ class Question(db.Model):
         order_index (int): Display order within the quiz
         created_at (datetime): When the question was created
         quiz_id (int): Foreign key linking to the parent quiz
+        correct_answer_id (int): The correct answer's ID, denormalized from
+            Answer.is_correct so scoring needs no answer lookups
         
     Relationships:
         quiz: Many-to-one relationship with Quiz model (via backref)
@@ -32,6 +34,10 @@ class Question(db.Model):
     """
     
     __tablename__ = 'question'
+    __table_args__ = (
+        # Foreign-key lookups (loading and counting a quiz's questions)
+        db.Index('ix_question_quiz_id', 'quiz_id'),
+    )
     
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
@@ -50,9 +56,22 @@ class Question(db.Model):
     
     # Foreign Keys
     quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False)
+    # Set by create_quiz alongside is_correct; use_alter breaks the
+    # question <-> answer creation cycle and SET NULL lets the answer
+    # cascade run before the question row is deleted
+    correct_answer_id = db.Column(
+        db.Integer,
+        db.ForeignKey('answer.id', use_alter=True, name='fk_question_correct_answer_id', ondelete='SET NULL'),
+        nullable=True
+    )
     
     # Relationships
-    answers: Mapped[list['Answer']] = relationship('Answer', backref='question', lazy=True, cascade='all, delete-orphan')
+    # Explicit ordering: without it the database may return answers in
+    # index order, putting the correct answer in a predictable position.
+    # raise_on_sql: callers must eager-load answers (selectinload), so an
+    # accidental per-question lazy load fails loudly instead of causing N+1
+    answers: Mapped[list['Answer']] = relationship('Answer', backref='question', lazy='raise_on_sql', cascade='all, delete-orphan',
+                                                   order_by='Answer.order_index', foreign_keys='Answer.question_id')
     
     def __repr__(self):
         """String representation of the Question object."""
@@ -119,5 +138,9 @@ class Question(db.Model):
         Returns:
             bool: True if the answer is correct, False otherwise
         """
-        correct_answer = self.get_correct_answer()
-        return correct_answer is not None and correct_answer.id == submitted_answer_id
+        correct_answer_id = self.correct_answer_id
+        if correct_answer_id is None:
+            # Not backfilled yet (see models.upgrade_schema); answers must be loaded
+            correct_answer = self.get_correct_answer()
+            correct_answer_id = correct_answer.id if correct_answer is not None else None
+        return correct_answer_id is not None and correct_answer_id == submitted_answer_id
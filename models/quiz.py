@@ -8,7 +8,8 @@ for assessment content.
 from models import db
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped, query_expression, relationship
 
 if TYPE_CHECKING:
     from .question import Question
@@ -27,6 +28,7 @@ class Quiz(db.Model):
         is_active (bool): Whether the quiz is currently active/available
         created_at (datetime): When the quiz was created
         updated_at (datetime): When the quiz was last modified
+        version (int): Incremented on every update; keys cached student views
         created_by (str): ID or name of the educator who created it
         
     Relationships:
@@ -52,11 +54,18 @@ class Quiz(db.Model):
     
     # Metadata
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=func.now())
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
     created_by = db.Column(db.String(100), nullable=True)  # Can store user ID or name
     
     # Relationships
-    questions: Mapped[list['Question']] = relationship('Question', backref='quiz', lazy=True, cascade='all, delete-orphan')
+    # raise_on_sql: callers must eager-load questions (selectinload), so an
+    # accidental lazy load fails loudly instead of causing N+1 queries
+    questions: Mapped[list['Question']] = relationship('Question', backref='quiz', lazy='raise_on_sql', cascade='all, delete-orphan')
+    
+    # Set by list queries (with_expression) from a COUNT subquery so they need
+    # not load every question; None otherwise, and to_dict counts questions
+    question_count = query_expression()
     
     def __repr__(self):
         """String representation of the Quiz object."""
@@ -83,7 +92,7 @@ class Quiz(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'created_by': self.created_by,
-            'question_count': len(self.questions)
+            'question_count': self.question_count if self.question_count is not None else len(self.questions)
         }
         
         if include_questions:
@@ -108,3 +117,7 @@ class Quiz(db.Model):
             'question_count': len(self.questions),
             'questions': [question.to_student_dict() for question in self.questions]
         }
+
+# Serves the default quiz listing (active quizzes, newest first) and its
+# keyset pagination seek on (created_at, id)
+db.Index('ix_quiz_active_created_id', Quiz.is_active, Quiz.created_at.desc(), Quiz.id.desc())
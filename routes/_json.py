@@ -0,0 +1,82 @@
+"""
+JSON response helpers for the route modules.
+
+Controllers build their responses through BaseController; routes that
+answer directly use fast_jsonify so every endpoint is encoded by orjson
+rather than flask.jsonify. conditional_get adds ETag validation to GETs,
+and limit_body_size rejects oversized request bodies.
+"""
+from flask import Response, request
+from functools import wraps
+from werkzeug.exceptions import RequestEntityTooLarge
+import orjson
+import re
+
+# Flask-Compress tags compressed bodies as "<etag>:<encoding>"
+_ETAG_ENCODING_SUFFIX = re.compile(r':(?:br|gzip|deflate)"')
+
+def fast_jsonify(obj, status=200, headers=None):
+    """
+    Serialize an object to a JSON response with orjson.
+    
+    Args:
+        obj: JSON-serializable data (bytes from orjson.dumps are sent as-is)
+        status (int): HTTP status code
+        headers (dict): Optional extra response headers
+        
+    Returns:
+        Response: application/json response
+    """
+    body = obj if isinstance(obj, bytes) else orjson.dumps(obj)
+    return Response(body, status=status, mimetype='application/json', headers=headers)
+
+def conditional_get(response):
+    """
+    after_request hook: tag successful GET responses with an ETag and answer
+    matching If-None-Match requests with 304 Not Modified.
+    
+    Clients that poll quizzes or the static lists then skip the body
+    transfer whenever the content has not changed.
+    
+    Args:
+        response (Response): The outgoing response
+        
+    Returns:
+        Response: The response, possibly turned into a 304
+    """
+    if request.method != 'GET' or response.status_code != 200 or response.is_streamed:
+        return response
+    
+    response.add_etag()
+    
+    # The client echoes back the ETag of the compressed body it received;
+    # compare on the uncompressed tag computed here
+    environ = request.environ
+    if_none_match = environ.get('HTTP_IF_NONE_MATCH')
+    if if_none_match and ':' in if_none_match:
+        environ = dict(environ, HTTP_IF_NONE_MATCH=_ETAG_ENCODING_SUFFIX.sub('"', if_none_match))
+    return response.make_conditional(environ)
+
+def limit_body_size(max_bytes):
+    """
+    Decorator rejecting requests whose declared body exceeds max_bytes.
+    
+    The check uses the Content-Length header alone, so the body is never
+    read or parsed. The 413 is raised rather than returned, so the
+    app-wide error handler serves the same body as the app's
+    MAX_CONTENT_LENGTH limit.
+    
+    Args:
+        max_bytes (int): Largest accepted Content-Length
+        
+    Returns:
+        function: Decorator for view functions
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.content_length and request.content_length > max_bytes:
+                raise RequestEntityTooLarge()
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -4,15 +4,21 @@ Basic routes for the Language Learning Quiz API.
 This module contains general API endpoints like health checks,
 root endpoint, and error handlers.
 """
-from flask import Blueprint, jsonify
+from flask import Blueprint
+from functools import lru_cache
+from werkzeug.exceptions import HTTPException
+from ._json import fast_jsonify
+import orjson
 import os
 
 # Create blueprint for basic routes
 basic_bp = Blueprint('basic', __name__)
 
+@lru_cache(maxsize=1)
 def get_api_info():
     """
     Get information about the API structure and available endpoints.
+    The result is computed once per process and must not be mutated.
     
     Returns:
         dict: API structure information
@@ -40,6 +46,7 @@ def get_api_info():
                 "methods": {
                     "POST /api/v1/quiz-sessions/start/{id}": "Start a quiz session",
                     "POST /api/v1/quiz-sessions/submit/{id}": "Submit quiz answers",
+                    "POST /api/v1/quiz-sessions/submit/batch": "Submit answers for several quizzes",
                     "GET /api/v1/quiz-sessions/preview/{id}": "Preview a quiz",
                     "GET /api/v1/quiz-sessions/stats/{id}": "Get quiz statistics",
                     "POST /api/v1/quiz-sessions/validate-answers": "Validate answer format",
@@ -68,6 +75,47 @@ def get_api_info():
         }
     }
 
+# The root, health and error payloads never change while the process is
+# running, so serialize them once at import instead of on every request
+_INDEX_BODY = orjson.dumps({
+    "message": "Welcome to the Language Learning Quiz API! 🎓",
+    "description": "A comprehensive quiz engine for language learning platforms",
+    "version": "1.0.0",
+    "api_info": get_api_info(),
+    "health": "OK",
+    "documentation": {
+        "note": "This API provides endpoints for creating and taking language learning quizzes",
+        "features": [
+            "Quiz creation and management for educators",
+            "Student quiz-taking with real-time feedback", 
+            "Multiple question types and difficulty levels",
+            "Time limits and performance tracking",
+            "Detailed scoring and explanations"
+        ]
+    }
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Language Learning Quiz API",
+    "version": "1.0.0",
+    "environment": os.getenv('FLASK_ENV', 'development')
+})
+
+def _error_body(error, message, **extra):
+    """Serialize an error payload in the standard error response format."""
+    return orjson.dumps({"success": False, "error": error, "message": message, **extra})
+
+# Prebuilt error bodies by status code, served by the app-wide handler below
+_ERROR_BODIES = {
+    400: _error_body("Bad request", "The request could not be understood"),
+    404: _error_body("Not found", "The requested resource was not found",
+                     available_endpoints=get_api_info()),
+    405: _error_body("Method not allowed", "The method is not allowed for the requested URL"),
+    413: _error_body("Payload too large", "The request body exceeds the maximum allowed size"),
+    500: _error_body("Internal server error", "An unexpected error occurred"),
+}
+
 @basic_bp.route('/')
 def index():
     """
@@ -76,24 +124,7 @@ def index():
     Returns:
         JSON: API information and available endpoints
     """
-    config_name = os.getenv('FLASK_ENV', 'development')
-    return jsonify({
-        "message": "Welcome to the Language Learning Quiz API! 🎓",
-        "description": "A comprehensive quiz engine for language learning platforms",
-        "version": "1.0.0",
-        "api_info": get_api_info(),
-        "health": "OK",
-        "documentation": {
-            "note": "This API provides endpoints for creating and taking language learning quizzes",
-            "features": [
-                "Quiz creation and management for educators",
-                "Student quiz-taking with real-time feedback", 
-                "Multiple question types and difficulty levels",
-                "Time limits and performance tracking",
-                "Detailed scoring and explanations"
-            ]
-        }
-    })
+    return fast_jsonify(_INDEX_BODY, headers={'Cache-Control': 'public, max-age=60'})
 
 @basic_bp.route('/health')
 def health_check():
@@ -103,29 +134,31 @@ def health_check():
     Returns:
         JSON: Health status information
     """
-    config_name = os.getenv('FLASK_ENV', 'development')
-    return jsonify({
-        "status": "healthy",
-        "service": "Language Learning Quiz API",
-        "version": "1.0.0",
-        "environment": config_name
-    })
+    # Probes must always reach the app, so never let proxies cache this
+    return fast_jsonify(_HEALTH_BODY, headers={'Cache-Control': 'no-store'})
 
-@basic_bp.errorhandler(404)
-def not_found(error):
-    """Handle 404 errors for this blueprint."""
-    return jsonify({
-        "success": False,
-        "error": "Not found",
-        "message": "The requested resource was not found",
-        "available_endpoints": get_api_info()
-    }), 404
-
-@basic_bp.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors for this blueprint."""
-    return jsonify({
-        "success": False,
-        "error": "Internal server error",
-        "message": "An unexpected error occurred"
-    }), 500
\ No newline at end of file
+@basic_bp.app_errorhandler(HTTPException)
+def handle_http_error(error):
+    """
+    Handle HTTP errors for the whole app with a JSON body.
+    
+    Unhandled exceptions reach this as a 500 InternalServerError.
+    
+    Args:
+        error (HTTPException): The raised HTTP error
+    
+    Returns:
+        Response: JSON error response with the error's status code
+    """
+    # Routing redirects (e.g. trailing slashes) are HTTPExceptions too
+    if error.code is None or error.code < 400:
+        return error
+    
+    body = _ERROR_BODIES.get(error.code)
+    if body is None:
+        body = _error_body(error.name, error.description)
+    
+    headers = None
+    if getattr(error, 'valid_methods', None):
+        headers = {'Allow': ', '.join(error.valid_methods)}
+    return fast_jsonify(body, error.code, headers)
\ No newline at end of file
@@ -5,12 +5,47 @@ This module defines HTTP endpoints for quiz CRUD operations.
 These routes are used by educators and administrators to manage quizzes.
 """
 from flask import Blueprint, request
-from controllers import QuizController
+from controllers import QuizController, DEFAULT_PAGE_SIZE, DIFFICULTY_LEVELS, MAX_JSON_BODY_BYTES, MAX_PAGE_SIZE
+from ._json import conditional_get, fast_jsonify, limit_body_size
+import orjson
 
 # Create the quiz blueprint
 quiz_bp = Blueprint('quiz', __name__, url_prefix='/api/v1/quizzes')
+quiz_bp.after_request(conditional_get)
+
+# This could be made dynamic by querying the database
+CATEGORIES = (
+    "Spanish", "French", "German", "Italian", "Portuguese",
+    "English Grammar", "Vocabulary", "Pronunciation", "Conversation"
+)
+
+# The category and difficulty lists are fixed, so their responses are
+# serialized once at import
+_CATEGORIES_BODY = orjson.dumps({
+    "success": True,
+    "message": "Categories retrieved successfully",
+    "data": {"categories": CATEGORIES}
+})
+
+_DIFFICULTY_LEVELS_BODY = orjson.dumps({
+    "success": True,
+    "message": "Difficulty levels retrieved successfully",
+    "data": {"difficulty_levels": DIFFICULTY_LEVELS}
+})
+
+# Fixed lists may be cached by clients and proxies
+_STATIC_LIST_HEADERS = {'Cache-Control': 'public, max-age=3600'}
+
+# Controller methods bound once at import so views skip the class attribute lookup
+_create = QuizController.create_quiz
+_get_all = QuizController.get_all_quizzes
+_get = QuizController.get_quiz
+_update = QuizController.update_quiz
+_delete = QuizController.delete_quiz
+_err = QuizController.error_response
 
 @quiz_bp.route('', methods=['POST'])
+@limit_body_size(MAX_JSON_BODY_BYTES)
 def create_quiz():
     """
     Create a new quiz.
@@ -43,12 +78,15 @@ def create_quiz():
     data = request.get_json()
     
     if not data:
-        return QuizController.error_response("Request body must be valid JSON", 400)
+        return _err("Request body must be valid JSON", 400)
+    
+    if not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
     
     # Extract creator info from headers if available (for future auth integration)
     created_by = request.headers.get('X-User-ID', 'anonymous')
     
-    return QuizController.create_quiz(data, created_by)
+    return _create(data, created_by)
 
 @quiz_bp.route('', methods=['GET'])
 def get_all_quizzes():
@@ -61,23 +99,27 @@ def get_all_quizzes():
         category (str): Filter by category
         difficulty (str): Filter by difficulty level
         active_only (bool): Only show active quizzes (default: true)
+        cursor (str): next_cursor from a previous response; switches to keyset
+            pagination, which is preferred for deep paging (page is ignored)
     
     Returns:
         JSON: Paginated list of quizzes
     """
     # Get query parameters
     page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 10, type=int), 100)
+    per_page = max(1, min(request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
     category = request.args.get('category')
     difficulty = request.args.get('difficulty')
     active_only = request.args.get('active_only', 'true').lower() == 'true'
+    cursor = request.args.get('cursor')
     
-    return QuizController.get_all_quizzes(
+    return _get_all(
         page=page,
         per_page=per_page,
         category=category,
         difficulty=difficulty,
-        active_only=active_only
+        active_only=active_only,
+        cursor=cursor
     )
 
 @quiz_bp.route('/<int:quiz_id>', methods=['GET'])
@@ -96,7 +138,7 @@ def get_quiz(quiz_id):
     """
     for_student = request.args.get('for_student', 'false').lower() == 'true'
     
-    return QuizController.get_quiz(quiz_id, for_student=for_student)
+    return _get(quiz_id, for_student=for_student)
 
 @quiz_bp.route('/<int:quiz_id>', methods=['PUT'])
 def update_quiz(quiz_id):
@@ -122,12 +164,15 @@ def update_quiz(quiz_id):
     data = request.get_json()
     
     if not data:
-        return QuizController.error_response("Request body must be valid JSON", 400)
+        return _err("Request body must be valid JSON", 400)
+    
+    if not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
     
     # Extract updater info from headers if available
     updated_by = request.headers.get('X-User-ID', 'anonymous')
     
-    return QuizController.update_quiz(quiz_id, data, updated_by)
+    return _update(quiz_id, data, updated_by)
 
 @quiz_bp.route('/<int:quiz_id>', methods=['DELETE'])
 def delete_quiz(quiz_id):
@@ -140,7 +185,7 @@ def delete_quiz(quiz_id):
     Returns:
         JSON: Success confirmation
     """
-    return QuizController.delete_quiz(quiz_id)
+    return _delete(quiz_id)
 
 @quiz_bp.route('/categories', methods=['GET'])
 def get_categories():
@@ -151,16 +196,7 @@ def get_categories():
     Returns:
         JSON: List of available categories
     """
-    # This could be made dynamic by querying the database
-    categories = [
-        "Spanish", "French", "German", "Italian", "Portuguese",
-        "English Grammar", "Vocabulary", "Pronunciation", "Conversation"
-    ]
-    
-    return QuizController.success_response(
-        data={"categories": categories},
-        message="Categories retrieved successfully"
-    )
+    return fast_jsonify(_CATEGORIES_BODY, headers=_STATIC_LIST_HEADERS)
 
 @quiz_bp.route('/difficulty-levels', methods=['GET'])
 def get_difficulty_levels():
@@ -170,20 +206,4 @@ def get_difficulty_levels():
     Returns:
         JSON: List of difficulty levels
     """
-    difficulty_levels = ["beginner", "intermediate", "advanced"]
-    
-    return QuizController.success_response(
-        data={"difficulty_levels": difficulty_levels},
-        message="Difficulty levels retrieved successfully"
-    )
-
-# Error handlers for this blueprint
-@quiz_bp.errorhandler(404)
-def not_found(error):
-    """Handle 404 errors for quiz routes."""
-    return QuizController.error_response("Quiz not found", 404)
-
-@quiz_bp.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors for quiz routes."""
-    return QuizController.error_response("Internal server error", 500)
+    return fast_jsonify(_DIFFICULTY_LEVELS_BODY, headers=_STATIC_LIST_HEADERS)
\ No newline at end of file
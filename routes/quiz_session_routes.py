@@ -5,10 +5,23 @@ This module defines HTTP endpoints for quiz-taking functionality.
 These routes are used by students to take quizzes and receive feedback.
 """
 from flask import Blueprint, request
-from controllers import QuizSessionController
+from controllers import QuizController, QuizSessionController, MAX_JSON_BODY_BYTES, MAX_SUBMITTED_ANSWERS
+from ._json import conditional_get, limit_body_size
 
 # Create the quiz session blueprint
 session_bp = Blueprint('quiz_session', __name__, url_prefix='/api/v1/quiz-sessions')
+session_bp.after_request(conditional_get)
+
+# Controller methods bound once at import so views skip the class attribute lookup
+_start = QuizSessionController.start_quiz_session
+_submit = QuizSessionController.submit_quiz
+_submit_batch = QuizSessionController.submit_quizzes
+_get_quiz = QuizController.get_quiz
+_stats = QuizSessionController.get_quiz_statistics
+_check_time = QuizSessionController.check_time_remaining
+_err = QuizSessionController.error_response
+_ok = QuizSessionController.success_response
+_validation_err = QuizSessionController.validation_error_response
 
 @session_bp.route('/start/<int:quiz_id>', methods=['POST'])
 def start_quiz_session(quiz_id):
@@ -29,19 +42,25 @@ def start_quiz_session(quiz_id):
     """
     data = request.get_json() or {}
     
+    if not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
+    
     # Extract student info from payload or headers
     student_id = data.get('student_id') or request.headers.get('X-Student-ID')
     
-    return QuizSessionController.start_quiz_session(quiz_id, student_id)
+    return _start(quiz_id, student_id)
 
 @session_bp.route('/submit/<int:quiz_id>', methods=['POST'])
+@limit_body_size(MAX_JSON_BODY_BYTES)
 def submit_quiz(quiz_id):
     """
     Submit answers for a quiz and get detailed results.
     
     Expected JSON payload:
     {
-        "started_at": "2023-09-22T10:30:00Z",  // Optional, for time validation
+        "session_token": "...",                 // Optional, from /start; preferred
+        "started_at_epoch": 1695378600,         // Optional, for time validation
+        "started_at": "2023-09-22T10:30:00Z",  // Optional, ISO alternative
         "answers": [
             {
                 "question_id": 1,
@@ -63,12 +82,56 @@ def submit_quiz(quiz_id):
     data = request.get_json()
     
     if not data:
-        return QuizSessionController.error_response("Request body must be valid JSON", 400)
+        return _err("Request body must be valid JSON", 400)
+    
+    if not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
     
     # Extract student info from headers if available
     student_id = request.headers.get('X-Student-ID')
     
-    return QuizSessionController.submit_quiz(quiz_id, data, student_id)
+    return _submit(quiz_id, data, student_id)
+
+@session_bp.route('/submit/batch', methods=['POST'])
+@limit_body_size(MAX_JSON_BODY_BYTES)
+def submit_quiz_batch():
+    """
+    Submit answers for several quizzes in one request.
+    
+    Each submission takes the same fields as /submit/<quiz_id> plus its
+    quiz_id, and gets its own entry in the results list.
+    
+    Expected JSON payload:
+    {
+        "submissions": [
+            {
+                "quiz_id": 1,
+                "session_token": "...",         // Optional, as for /submit
+                "answers": [
+                    {"question_id": 1, "answer_id": 3}
+                ]
+            }
+        ]
+    }
+    
+    Returns:
+        JSON: Per-submission results, in request order
+    """
+    data = request.get_json()
+    
+    if not data:
+        return _err("Request body must be valid JSON", 400)
+    
+    if not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
+    
+    if 'submissions' not in data:
+        return _err("Missing 'submissions' field", 422)
+    
+    # Extract student info from headers if available
+    student_id = request.headers.get('X-Student-ID')
+    
+    return _submit_batch(data['submissions'], student_id)
 
 @session_bp.route('/preview/<int:quiz_id>', methods=['GET'])
 def preview_quiz(quiz_id):
@@ -82,9 +145,9 @@ def preview_quiz(quiz_id):
     Returns:
         JSON: Quiz preview information
     """
-    # This reuses the get_quiz method with student flag
-    from controllers import QuizController
-    return QuizController.get_quiz(quiz_id, for_student=True)
+    # Same payload as the student view of GET /quizzes/<id>; the blueprint's
+    # conditional_get hook gives it an ETag so unchanged previews return 304
+    return _get_quiz(quiz_id, for_student=True)
 
 @session_bp.route('/stats/<int:quiz_id>', methods=['GET'])
 def get_quiz_statistics(quiz_id):
@@ -97,11 +160,12 @@ def get_quiz_statistics(quiz_id):
     Returns:
         JSON: Quiz performance statistics
     """
-    return QuizSessionController.get_quiz_statistics(quiz_id)
+    return _stats(quiz_id)
 
 # Additional helper endpoints
 
 @session_bp.route('/validate-answers', methods=['POST'])
+@limit_body_size(MAX_JSON_BODY_BYTES)
 def validate_answers_format():
     """
     Validate the format of answer submission without actually submitting.
@@ -121,36 +185,57 @@ def validate_answers_format():
     data = request.get_json()
     
     if not data:
-        return QuizSessionController.error_response("Request body must be valid JSON", 400)
+        return _err("Request body must be valid JSON", 400)
+    
+    if not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
     
     if 'answers' not in data:
-        return QuizSessionController.error_response("Missing 'answers' field", 422)
+        return _err("Missing 'answers' field", 422)
     
     answers = data['answers']
+    
+    # Bound the work before the per-answer checks, matching submit limits
+    if not isinstance(answers, list):
+        return _err("'answers' must be a list", 422)
+    
+    if len(answers) > MAX_SUBMITTED_ANSWERS:
+        return _err(
+            f"A submission can include at most {MAX_SUBMITTED_ANSWERS} answers", 422
+        )
+    
     errors = []
     
     for i, answer in enumerate(answers):
         if not isinstance(answer, dict):
             errors.append(f"Answer {i} must be an object")
             continue
-            
-        if 'question_id' not in answer:
+        
+        # One lookup per field; None marks a missing key
+        question_id = answer.get('question_id')
+        answer_id = answer.get('answer_id')
+        
+        if question_id is None and 'question_id' not in answer:
             errors.append(f"Answer {i} missing 'question_id'")
+            question_id = 0
             
-        if 'answer_id' not in answer:
+        if answer_id is None and 'answer_id' not in answer:
             errors.append(f"Answer {i} missing 'answer_id'")
-            
-        # Validate that IDs are integers
+            answer_id = 0
+        
+        # Validate that IDs are integers; plain ints, the usual case, need no conversion
+        if type(question_id) is int and type(answer_id) is int:
+            continue
         try:
-            int(answer.get('question_id', 0))
-            int(answer.get('answer_id', 0))
+            int(question_id)
+            int(answer_id)
         except (ValueError, TypeError):
             errors.append(f"Answer {i} IDs must be integers")
     
     if errors:
-        return QuizSessionController.validation_error_response({"format_errors": errors})
+        return _validation_err({"format_errors": errors})
     
-    return QuizSessionController.success_response(
+    return _ok(
         data={"valid": True, "answer_count": len(answers)},
         message="Answer format is valid"
     )
@@ -160,8 +245,10 @@ def check_time_remaining(quiz_id):
     """
     Check remaining time for a quiz session.
     
-    Expected JSON payload:
+    Expected JSON payload (one of the fields; session_token is preferred):
     {
+        "session_token": "<session_info.session_token from /start>",
+        "started_at_epoch": 1695378600,
         "started_at": "2023-09-22T10:30:00Z"
     }
     
@@ -173,48 +260,10 @@ def check_time_remaining(quiz_id):
     """
     data = request.get_json()
     
-    if not data or 'started_at' not in data:
-        return QuizSessionController.error_response("Missing 'started_at' field", 422)
-    
-    from models import Quiz
-    from datetime import datetime, timedelta
-    
-    quiz = Quiz.query.get(quiz_id)
+    if data and not isinstance(data, dict):
+        return _err("Request body must be a JSON object", 400)
     
-    if not quiz:
-        return QuizSessionController.error_response("Quiz not found", 404)
+    if not data or not any(field in data for field in ('session_token', 'started_at_epoch', 'started_at')):
+        return _err("Missing 'started_at' field", 422)
     
-    if not quiz.time_limit:
-        return QuizSessionController.success_response(
-            data={"unlimited": True},
-            message="This quiz has no time limit"
-        )
-    
-    try:
-        started_at = datetime.fromisoformat(data['started_at'].replace('Z', '+00:00'))
-        elapsed_minutes = (datetime.utcnow() - started_at).total_seconds() / 60
-        remaining_minutes = max(0, quiz.time_limit - elapsed_minutes)
-        
-        return QuizSessionController.success_response(
-            data={
-                "time_limit_minutes": quiz.time_limit,
-                "elapsed_minutes": round(elapsed_minutes, 2),
-                "remaining_minutes": round(remaining_minutes, 2),
-                "is_expired": remaining_minutes <= 0
-            },
-            message="Time check completed"
-        )
-        
-    except (ValueError, TypeError):
-        return QuizSessionController.error_response("Invalid 'started_at' format", 422)
-
-# Error handlers for this blueprint
-@session_bp.errorhandler(404)
-def not_found(error):
-    """Handle 404 errors for session routes."""
-    return QuizSessionController.error_response("Quiz session not found", 404)
-
-@session_bp.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors for session routes."""
-    return QuizSessionController.error_response("Internal server error", 500)
\ No newline at end of file
+    return _check_time(quiz_id, data)
\ No newline at end of file
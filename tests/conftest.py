@@ -0,0 +1,76 @@
+"""
+Shared pytest fixtures for the Language Learning Quiz API tests.
+
+Every test gets a fresh app backed by its own in-memory SQLite database.
+"""
+import os
+
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+import pytest
+
+from app import create_app
+from controllers.quiz_controller import _quiz_snapshot, _render_student_quiz
+
+@pytest.fixture
+def app():
+    """Create a testing app with an empty schema."""
+    # Quiz IDs restart at 1 in every database, so drop process-level caches
+    _quiz_snapshot.cache_clear()
+    _render_student_quiz.cache_clear()
+    app = create_app('testing')
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Test client for the testing app."""
+    return app.test_client()
+
+@pytest.fixture
+def make_quiz(client):
+    """
+    Factory creating a quiz through the API.
+    
+    Returns:
+        function: make_quiz(**overrides) -> created quiz data (educator view)
+    """
+    def _make_quiz(**overrides):
+        payload = {
+            "title": "Spanish Basics",
+            "category": "Spanish",
+            "difficulty_level": "beginner",
+            "questions": [
+                {
+                    "text": "What is the Spanish word for 'hello'?",
+                    "points": 1,
+                    "answers": [
+                        {"text": "Hola", "is_correct": True},
+                        {"text": "Adiós"}
+                    ]
+                },
+                {
+                    "text": "What is the Spanish word for 'thanks'?",
+                    "points": 2,
+                    "answers": [
+                        {"text": "Por favor"},
+                        {"text": "Gracias", "is_correct": True}
+                    ]
+                }
+            ]
+        }
+        payload.update(overrides)
+        response = client.post('/api/v1/quizzes', json=payload)
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['data']
+    
+    return _make_quiz
+
+def correct_answers(quiz):
+    """Build an answers payload answering every question of a quiz correctly."""
+    return [
+        {
+            "question_id": question['id'],
+            "answer_id": next(answer['id'] for answer in question['answers'] if answer['is_correct'])
+        }
+        for question in quiz['questions']
+    ]
@@ -0,0 +1,12 @@
+"""
+Tests for the application factory.
+"""
+from collections import Counter
+
+def test_every_route_is_registered_once(app):
+    rules = Counter((rule.rule, frozenset(rule.methods)) for rule in app.url_map.iter_rules())
+    
+    duplicates = [rule for rule, count in rules.items() if count > 1]
+    assert duplicates == []
+    # Guard against an empty map making the check above vacuous
+    assert ('/api/v1/quizzes', frozenset({'GET', 'HEAD', 'OPTIONS'})) in rules
@@ -0,0 +1,35 @@
+"""
+Tests for the batch quiz submission endpoint.
+"""
+import pytest
+
+from tests.conftest import correct_answers
+
+BATCH_URL = '/api/v1/quiz-sessions/submit/batch'
+
+def test_batch_scores_each_submission(client, make_quiz):
+    quiz = make_quiz()
+    
+    response = client.post(BATCH_URL, json={"submissions": [
+        {"quiz_id": quiz['id'], "answers": correct_answers(quiz)},
+        {"quiz_id": 999, "answers": []},
+        {"quiz_id": quiz['id']}
+    ]})
+    
+    assert response.status_code == 200
+    results = response.get_json()['data']['results']
+    assert results[0]['success'] and results[0]['data']['score_summary']['correct_answers'] == 2
+    assert (results[1]['success'], results[1]['status']) == (False, 404)
+    assert (results[2]['success'], results[2]['status']) == (False, 422)
+
+@pytest.mark.parametrize('body', ['5', '[1, 2]', '"submissions"', 'true'])
+def test_batch_rejects_non_object_body(client, body):
+    response = client.post(BATCH_URL, data=body, content_type='application/json')
+    
+    assert response.status_code == 400
+
+@pytest.mark.parametrize('submissions', [5, "abc", {"quiz_id": 1}, [], None])
+def test_batch_rejects_non_list_submissions(client, submissions):
+    response = client.post(BATCH_URL, json={"submissions": submissions})
+    
+    assert response.status_code == 422
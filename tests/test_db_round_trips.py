@@ -0,0 +1,71 @@
+"""
+Regression tests for database round trips on the quiz list.
+"""
+import importlib
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+import config
+from models import db
+
+@contextmanager
+def count_round_trips(app):
+    """
+    Count statements and pre-ping checks issued against the app's engine.
+    
+    Yields:
+        dict: {'statements': int, 'pings': int}, updated while the block runs
+    """
+    counts = {'statements': 0, 'pings': 0}
+    with app.app_context():
+        engine = db.engine
+    
+    def on_execute(*args):
+        counts['statements'] += 1
+    
+    original_ping = engine.dialect.do_ping
+    def counting_ping(dbapi_connection):
+        counts['pings'] += 1
+        return original_ping(dbapi_connection)
+    
+    event.listen(engine, 'before_cursor_execute', on_execute)
+    engine.dialect.do_ping = counting_ping
+    try:
+        yield counts
+    finally:
+        event.remove(engine, 'before_cursor_execute', on_execute)
+        engine.dialect.do_ping = original_ping
+
+def test_cursor_page_is_a_single_round_trip(app, client, make_quiz):
+    for i in range(3):
+        make_quiz(title=f"Quiz {i}")
+    cursor = client.get('/api/v1/quizzes?per_page=1').get_json()['data']['pagination']['next_cursor']
+    
+    with count_round_trips(app) as counts:
+        response = client.get('/api/v1/quizzes', query_string={'per_page': 1, 'cursor': cursor})
+    
+    assert response.status_code == 200
+    assert counts == {'statements': 1, 'pings': 0}
+
+def test_numbered_page_adds_only_the_count_query(app, client, make_quiz):
+    make_quiz()
+    
+    with count_round_trips(app) as counts:
+        response = client.get('/api/v1/quizzes')
+    
+    assert response.status_code == 200
+    assert counts == {'statements': 2, 'pings': 0}
+
+@pytest.mark.parametrize('config_name', ['development', 'testing'])
+def test_pre_ping_is_off_unless_enabled(monkeypatch, config_name):
+    monkeypatch.delenv('DB_POOL_PRE_PING', raising=False)
+    # Engine options are read from the environment at import time
+    reloaded = importlib.reload(config)
+    try:
+        options = reloaded.config[config_name].SQLALCHEMY_ENGINE_OPTIONS
+        assert not options.get('pool_pre_ping', False)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
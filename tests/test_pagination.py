@@ -0,0 +1,79 @@
+"""
+Tests for quiz list pagination.
+"""
+import pytest
+
+from controllers import QuizController
+
+LIST_URL = '/api/v1/quizzes'
+
+def _titles(response):
+    return [quiz['title'] for quiz in response.get_json()['data']['quizzes']]
+
+def test_cursor_walks_every_quiz_once(client, make_quiz):
+    for i in range(5):
+        make_quiz(title=f"Quiz {i}")
+    
+    seen = []
+    response = client.get(f'{LIST_URL}?per_page=2')
+    while True:
+        seen += _titles(response)
+        next_cursor = response.get_json()['data']['pagination']['next_cursor']
+        if not next_cursor:
+            break
+        response = client.get(LIST_URL, query_string={'per_page': 2, 'cursor': next_cursor})
+    
+    assert seen == [f"Quiz {i}" for i in reversed(range(5))]
+
+@pytest.mark.parametrize('per_page', [0, -1, -50])
+def test_keyset_page_with_out_of_range_per_page_returns_one_quiz(client, make_quiz, per_page):
+    for i in range(3):
+        make_quiz(title=f"Quiz {i}")
+    cursor = client.get(f'{LIST_URL}?per_page=1').get_json()['data']['pagination']['next_cursor']
+    
+    response = client.get(LIST_URL, query_string={'per_page': per_page, 'cursor': cursor})
+    
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert _titles(response) == ["Quiz 1"]
+    assert data['pagination']['per_page'] == 1
+    assert data['pagination']['has_next'] is True
+    assert data['pagination']['next_cursor']
+
+@pytest.mark.parametrize('per_page', [0, -5])
+def test_controller_clamps_keyset_per_page_from_below(app, client, make_quiz, per_page):
+    for i in range(3):
+        make_quiz(title=f"Quiz {i}")
+    cursor = client.get(f'{LIST_URL}?per_page=1').get_json()['data']['pagination']['next_cursor']
+    
+    with app.test_request_context():
+        response, status_code = QuizController.get_all_quizzes(per_page=per_page, cursor=cursor)
+    
+    assert status_code == 200
+    data = response.get_json()['data']
+    assert [quiz['title'] for quiz in data['quizzes']] == ["Quiz 1"]
+    assert data['pagination'] == {'per_page': 1, 'has_next': True, 'next_cursor': data['pagination']['next_cursor']}
+    assert data['pagination']['next_cursor']
+
+@pytest.mark.parametrize('cursor', [
+    'not-a-cursor',
+    '2024-01-01T00:00:00:abc',
+    '2024-01-01T00:00:00:99999999999999999999',
+    '2024-01-01T00:00:00:-99999999999999999999',
+    '2024-01-01T00:00:00:9223372036854775808',
+])
+def test_invalid_cursor_is_422(client, make_quiz, cursor):
+    make_quiz()
+    
+    response = client.get(LIST_URL, query_string={'cursor': cursor})
+    
+    assert response.status_code == 422
+    assert response.get_json()['message'] == "Invalid cursor"
+
+def test_cursor_at_bigint_limit_is_accepted(client, make_quiz):
+    make_quiz()
+    
+    response = client.get(LIST_URL, query_string={'cursor': '2999-01-01T00:00:00:9223372036854775807'})
+    
+    assert response.status_code == 200
+    assert len(_titles(response)) == 1
@@ -0,0 +1,48 @@
+"""
+Tests for the process-level quiz snapshot and student view caches.
+"""
+from sqlalchemy import delete
+
+from models import db, Quiz, Question, Answer
+
+def _delete_behind_cache(app, quiz_id):
+    """Delete a quiz without invalidating this process's caches, as another worker would."""
+    with app.app_context():
+        question_ids = db.session.scalars(db.select(Question.id).where(Question.quiz_id == quiz_id)).all()
+        db.session.execute(delete(Answer).where(Answer.question_id.in_(question_ids)))
+        db.session.execute(delete(Question).where(Question.quiz_id == quiz_id))
+        db.session.execute(delete(Quiz).where(Quiz.id == quiz_id))
+        db.session.commit()
+
+def test_student_view_of_quiz_deleted_elsewhere_is_404(app, client, make_quiz):
+    quiz = make_quiz()
+    # Caches the snapshot without rendering the student view
+    assert client.get(f"/api/v1/quizzes/{quiz['id']}").status_code == 200
+    _delete_behind_cache(app, quiz['id'])
+    
+    response = client.get(f"/api/v1/quizzes/{quiz['id']}?for_student=true")
+    
+    assert response.status_code == 404
+    assert response.get_json()['message'] == "Quiz not found"
+
+def test_session_start_of_quiz_deleted_elsewhere_is_404(app, client, make_quiz):
+    quiz = make_quiz()
+    assert client.get(f"/api/v1/quizzes/{quiz['id']}").status_code == 200
+    _delete_behind_cache(app, quiz['id'])
+    
+    assert client.post(f"/api/v1/quiz-sessions/start/{quiz['id']}", json={}).status_code == 404
+    # The stale snapshot was dropped, so later lookups stop at the snapshot
+    assert client.get(f"/api/v1/quiz-sessions/preview/{quiz['id']}").status_code == 404
+
+def test_back_to_back_updates_refresh_the_student_view(client, make_quiz):
+    quiz = make_quiz(title="T1")
+    url = f"/api/v1/quizzes/{quiz['id']}"
+    
+    # Both updates land within the same second, so updated_at may not change
+    for title in ("T2", "T3"):
+        assert client.put(url, json={"title": title}).status_code == 200
+        student_view = client.get(f"{url}?for_student=true").get_json()['data']
+        session = client.post(f"/api/v1/quiz-sessions/start/{quiz['id']}", json={}).get_json()['data']
+        
+        assert student_view['title'] == title
+        assert session['quiz']['title'] == title
@@ -0,0 +1,31 @@
+"""
+Tests for request bodies that are valid JSON but not JSON objects.
+"""
+import pytest
+
+NON_OBJECT_BODIES = ['["answers"]', '"answers"', '5', 'true']
+
+@pytest.mark.parametrize('body', NON_OBJECT_BODIES)
+def test_submit_rejects_non_object_body(client, make_quiz, body):
+    quiz = make_quiz()
+    
+    response = client.post(f"/api/v1/quiz-sessions/submit/{quiz['id']}", data=body, content_type='application/json')
+    
+    assert response.status_code == 400
+    assert response.get_json()['message'] == "Request body must be a JSON object"
+
+@pytest.mark.parametrize('body', NON_OBJECT_BODIES)
+@pytest.mark.parametrize('method,path', [
+    ('post', '/api/v1/quizzes'),
+    ('put', '/api/v1/quizzes/{id}'),
+    ('post', '/api/v1/quiz-sessions/start/{id}'),
+    ('post', '/api/v1/quiz-sessions/time-check/{id}'),
+    ('post', '/api/v1/quiz-sessions/validate-answers'),
+])
+def test_json_endpoints_reject_non_object_body(client, make_quiz, method, path, body):
+    quiz = make_quiz(time_limit=30)
+    
+    response = getattr(client, method)(path.format(id=quiz['id']), data=body, content_type='application/json')
+    
+    assert response.status_code == 400
+    assert response.get_json()['message'] == "Request body must be a JSON object"
@@ -0,0 +1,39 @@
+"""
+Tests for request body size limits.
+"""
+import orjson
+import pytest
+
+from controllers import MAX_JSON_BODY_BYTES
+
+LIMITED_URLS = [
+    '/api/v1/quizzes',
+    '/api/v1/quiz-sessions/submit/1',
+    '/api/v1/quiz-sessions/submit/batch',
+    '/api/v1/quiz-sessions/validate-answers',
+]
+
+def _body_of_size(size):
+    """A valid JSON object body of exactly size bytes."""
+    return orjson.dumps({"padding": "x" * (size - len(b'{"padding":""}'))})
+
+@pytest.mark.parametrize('url', LIMITED_URLS)
+def test_oversized_json_body_is_rejected_before_parsing(client, url):
+    response = client.post(url, data=_body_of_size(MAX_JSON_BODY_BYTES + 1), content_type='application/json')
+    
+    assert response.status_code == 413
+    assert response.get_json()['error'] == "Payload too large"
+
+def test_per_view_limit_matches_app_limit_body(app, client):
+    per_view = client.post(LIMITED_URLS[0], data=_body_of_size(MAX_JSON_BODY_BYTES + 1), content_type='application/json')
+    app_wide = client.put('/api/v1/quizzes/1', data=_body_of_size(app.config['MAX_CONTENT_LENGTH'] + 1),
+                          content_type='application/json')
+    
+    assert app_wide.status_code == 413
+    assert per_view.get_data() == app_wide.get_data()
+
+def test_body_at_the_limit_is_accepted(client):
+    response = client.post(LIMITED_URLS[-1], data=_body_of_size(MAX_JSON_BODY_BYTES), content_type='application/json')
+    
+    # Parsed and rejected on content, not size
+    assert response.status_code == 422
@@ -0,0 +1,70 @@
+"""
+Tests for quiz submission scoring.
+"""
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.orm import selectinload
+
+from models import db, Question, upgrade_schema
+from tests.conftest import correct_answers
+
+def _clear_correct_answer_ids(app):
+    """Simulate questions stored before correct_answer_id existed."""
+    with app.app_context():
+        db.session.execute(update(Question).values(correct_answer_id=None))
+        db.session.commit()
+
+def test_submission_scores_correct_answers(client, make_quiz):
+    quiz = make_quiz()
+    
+    response = client.post(f"/api/v1/quiz-sessions/submit/{quiz['id']}", json={"answers": correct_answers(quiz)})
+    
+    assert response.status_code == 200
+    summary = response.get_json()['data']['score_summary']
+    assert summary['correct_answers'] == 2
+    assert summary['points_earned'] == 3
+
+def test_submission_falls_back_to_is_correct_when_correct_answer_id_is_null(app, client, make_quiz):
+    quiz = make_quiz()
+    _clear_correct_answer_ids(app)
+    
+    response = client.post(f"/api/v1/quiz-sessions/submit/{quiz['id']}", json={"answers": correct_answers(quiz)})
+    
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['score_summary']['correct_answers'] == 2
+    assert data['score_summary']['points_percentage'] == 100.0
+    assert all(result['correct_answer'] is not None for result in data['question_results'])
+
+def test_validate_answer_falls_back_to_is_correct(app, make_quiz):
+    quiz = make_quiz()
+    _clear_correct_answer_ids(app)
+    expected = correct_answers(quiz)[0]
+    
+    with app.app_context():
+        # answers is raise_on_sql, so callers must eager-load it
+        question = db.session.get(Question, expected['question_id'], options=[selectinload(Question.answers)])
+        
+        assert question.validate_answer(expected['answer_id'])
+        assert not question.validate_answer(expected['answer_id'] + 1)
+
+def test_upgrade_schema_backfills_correct_answer_id(app, make_quiz):
+    quiz = make_quiz()
+    _clear_correct_answer_ids(app)
+    
+    with app.app_context():
+        upgrade_schema()
+        upgrade_schema()  # Safe to run again
+        stored = dict(db.session.execute(select(Question.id, Question.correct_answer_id)).all())
+    
+    assert stored == {answer['question_id']: answer['answer_id'] for answer in correct_answers(quiz)}
+
+def test_upgrade_schema_drops_superseded_answer_index(app):
+    with app.app_context():
+        db.session.execute(text('CREATE INDEX ix_answer_question_correct ON answer (question_id, is_correct)'))
+        db.session.commit()
+        
+        upgrade_schema()
+        index_names = {index['name'] for index in inspect(db.engine).get_indexes('answer')}
+    
+    assert 'ix_answer_question_correct' not in index_names
+    assert {'ix_answer_question_id', 'ix_answer_correct_partial'} <= index_names
@@ -0,0 +1,65 @@
+"""
+Tests for quiz session start tokens and time limits.
+"""
+import time
+
+import pytest
+from itsdangerous import URLSafeSerializer
+
+from controllers.quiz_session_controller import _SESSION_TOKEN_SALT
+from tests.conftest import correct_answers
+
+def _start(client, quiz_id):
+    response = client.post(f'/api/v1/quiz-sessions/start/{quiz_id}', json={})
+    assert response.status_code == 200
+    return response.get_json()['data']['session_info']
+
+def _forge(app, quiz_id, started_at_epoch):
+    return URLSafeSerializer(app.config['SECRET_KEY'], salt=_SESSION_TOKEN_SALT).dumps([quiz_id, started_at_epoch])
+
+def test_submit_with_valid_token_is_scored(client, make_quiz):
+    quiz = make_quiz(time_limit=30)
+    token = _start(client, quiz['id'])['session_token']
+    
+    response = client.post(f"/api/v1/quiz-sessions/submit/{quiz['id']}",
+                           json={"session_token": token, "answers": correct_answers(quiz)})
+    
+    assert response.status_code == 200
+
+def test_submit_with_expired_token_is_rejected(app, client, make_quiz):
+    quiz = make_quiz(time_limit=30)
+    token = _forge(app, quiz['id'], int(time.time()) - 31 * 60)
+    
+    response = client.post(f"/api/v1/quiz-sessions/submit/{quiz['id']}", json={"session_token": token, "answers": []})
+    
+    assert response.status_code == 422
+    assert response.get_json()['message'] == "Time limit exceeded for this quiz"
+
+@pytest.mark.parametrize('time_limit', [30, None])
+@pytest.mark.parametrize('bad_token', ['not-a-token', 'tampered', 'other-quiz', 12345])
+def test_submit_with_bad_token_is_rejected(client, make_quiz, time_limit, bad_token):
+    quiz = make_quiz(time_limit=time_limit)
+    other = make_quiz()
+    token = _start(client, quiz['id'])['session_token']
+    bad_token = {
+        'tampered': token[:-2] + ('AA' if not token.endswith('AA') else 'BB'),
+        'other-quiz': _start(client, other['id'])['session_token'],
+    }.get(bad_token, bad_token)
+    
+    # A fresh client-side start time must not rescue a bad token
+    response = client.post(f"/api/v1/quiz-sessions/submit/{quiz['id']}", json={
+        "session_token": bad_token,
+        "started_at_epoch": int(time.time()),
+        "answers": []
+    })
+    
+    assert response.status_code == 422
+    assert response.get_json()['message'] == "Invalid session token"
+
+def test_time_check_rejects_bad_token(client, make_quiz):
+    quiz = make_quiz(time_limit=30)
+    
+    response = client.post(f"/api/v1/quiz-sessions/time-check/{quiz['id']}", json={"session_token": "nope"})
+    
+    assert response.status_code == 422
+    assert response.get_json()['message'] == "Invalid session token"
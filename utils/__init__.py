@@ -0,0 +1,6 @@
+"""
+Utilities package initialization for the Language Learning Quiz API.
+"""
+from .helpers import ttl_cache
+
+__all__ = ['ttl_cache']
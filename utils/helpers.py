@@ -0,0 +1,59 @@
+"""
+Helper utilities for the Language Learning Quiz API.
+
+This module contains small, framework-independent helpers that are
+shared across controllers and routes.
+"""
+import time
+from functools import wraps
+
+def ttl_cache(ttl, maxsize=1024):
+    """
+    Decorator that memoizes a function for a limited time.
+    
+    The cache is local to the worker process, so other workers only see a
+    change once their own entry expires. Keep the TTL short for data that can
+    be modified through the API.
+    
+    Args:
+        ttl (float): Seconds an entry stays valid
+        maxsize (int): Maximum number of cached entries
+        
+    Returns:
+        function: Decorator; the wrapped function gains cache_pop(*args)
+            and cache_clear() for explicit invalidation
+    """
+    def decorator(func):
+        cache = {}
+        
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            
+            value = func(*args)
+            
+            if len(cache) >= maxsize:
+                # Drop expired entries first, then the oldest ones
+                for key in [k for k, (expires, _) in list(cache.items()) if expires <= now]:
+                    cache.pop(key, None)
+                while len(cache) >= maxsize:
+                    try:
+                        cache.pop(next(iter(cache)), None)
+                    except (StopIteration, RuntimeError):
+                        break
+            
+            cache[args] = (now + ttl, value)
+            return value
+        
+        def cache_pop(*args):
+            """Remove a single entry from the cache."""
+            cache.pop(args, None)
+        
+        wrapper.cache_pop = cache_pop
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator